@@ -0,0 +1,48 @@
+"""project translation search vector
+
+Revision ID: 3f8a1c2d9b47
+Revises: da34293246c4
+Create Date: 2026-10-17 09:12:40.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a1c2d9b47'
+down_revision: Union[str, Sequence[str], None] = 'da34293246c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_CFG = "CASE lang WHEN 'en' THEN 'english'::regconfig WHEN 'vi' THEN 'simple'::regconfig ELSE 'simple'::regconfig END"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector({_CFG}, coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector({_CFG}, coalesce(summary, '')), 'B') || "
+    f"setweight(to_tsvector({_CFG}, coalesce(content_markdown, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # STORED generated column: adding it rewrites the table, which backfills every existing row
+    op.add_column(
+        'project_translations',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True),
+    )
+    op.create_index(
+        'ix_project_translations_search_vector',
+        'project_translations',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_project_translations_search_vector', table_name='project_translations', postgresql_using='gin')
+    op.drop_column('project_translations', 'search_vector')
@@ -0,0 +1,81 @@
+"""project cards
+
+Revision ID: 5d3b8f1e7a62
+Revises: e4a7c9d2f015
+Create Date: 2026-10-17 14:20:09.663412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3b8f1e7a62'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c9d2f015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('project_cards',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('lang', sa.String(), nullable=False),
+    sa.Column('slug', sa.String(), nullable=False),
+    sa.Column('cover_image_url', sa.String(), nullable=True),
+    sa.Column('repo_url', sa.String(), nullable=True),
+    sa.Column('demo_url', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('summary', sa.String(), nullable=True),
+    sa.Column('content_markdown', sa.String(), nullable=True),
+    sa.Column('content_html', sa.Text(), nullable=True),
+    sa.Column('content_toc', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('reading_minutes', sa.Integer(), nullable=True),
+    sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    sa.Column('tag_ids', postgresql.ARRAY(sa.Integer()), server_default=sa.text("'{}'::integer[]"), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'lang')
+    )
+    op.create_index('ix_project_cards_listing', 'project_cards', ['lang', 'status', sa.text('published_at DESC NULLS LAST'), sa.text('project_id DESC')], unique=False)
+    op.create_index('ix_project_cards_slug_lang', 'project_cards', ['slug', 'lang'], unique=True)
+    op.create_index('ix_project_cards_tag_ids', 'project_cards', ['tag_ids'], unique=False, postgresql_using='gin')
+    op.create_index('ix_project_cards_search_vector', 'project_cards', ['search_vector'], unique=False, postgresql_using='gin')
+
+    op.execute("""
+        INSERT INTO project_cards (
+            project_id, lang, slug, cover_image_url, repo_url, demo_url, status, published_at,
+            title, summary, content_markdown, content_html, content_toc, reading_minutes,
+            tags, tag_ids, search_vector
+        )
+        SELECT
+            p.id, t.lang, p.slug, p.cover_image_url, p.repo_url, p.demo_url, p.status, p.published_at,
+            t.title, t.summary, t.content_markdown, t.content_html, t.content_toc, t.reading_minutes,
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object('id', tg.id, 'slug', tg.slug, 'name', COALESCE(tt.name, tg.slug)) ORDER BY tg.id)
+                FROM project_tags pt
+                JOIN tags tg ON tg.id = pt.tag_id
+                LEFT JOIN tag_translations tt ON tt.tag_id = tg.id AND tt.lang = t.lang
+                WHERE pt.project_id = p.id
+            ), '[]'::jsonb),
+            COALESCE((
+                SELECT array_agg(pt.tag_id ORDER BY pt.tag_id) FROM project_tags pt WHERE pt.project_id = p.id
+            ), '{}'::integer[]),
+            t.search_vector
+        FROM projects p
+        JOIN project_translations t ON t.project_id = p.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_project_cards_search_vector', table_name='project_cards', postgresql_using='gin')
+    op.drop_index('ix_project_cards_tag_ids', table_name='project_cards', postgresql_using='gin')
+    op.drop_index('ix_project_cards_slug_lang', table_name='project_cards')
+    op.drop_index('ix_project_cards_listing', table_name='project_cards')
+    op.drop_table('project_cards')
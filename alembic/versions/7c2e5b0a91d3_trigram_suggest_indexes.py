@@ -0,0 +1,45 @@
+"""trigram suggest indexes
+
+Revision ID: 7c2e5b0a91d3
+Revises: 3f8a1c2d9b47
+Create Date: 2026-10-17 10:03:17.552964
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5b0a91d3'
+down_revision: Union[str, Sequence[str], None] = '3f8a1c2d9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_project_translations_title_trgm',
+        'project_translations',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_tag_translations_name_trgm',
+        'tag_translations',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tag_translations_name_trgm', table_name='tag_translations', postgresql_using='gin')
+    op.drop_index('ix_project_translations_title_trgm', table_name='project_translations', postgresql_using='gin')
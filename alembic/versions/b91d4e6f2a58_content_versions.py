@@ -0,0 +1,34 @@
+"""content versions
+
+Revision ID: b91d4e6f2a58
+Revises: 7c2e5b0a91d3
+Create Date: 2026-10-17 11:26:05.190337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91d4e6f2a58'
+down_revision: Union[str, Sequence[str], None] = '7c2e5b0a91d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    content_versions = op.create_table('content_versions',
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('scope')
+    )
+    op.bulk_insert(content_versions, [{'scope': 'projects', 'version': 0}, {'scope': 'tags', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('content_versions')
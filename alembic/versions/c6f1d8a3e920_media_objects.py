@@ -0,0 +1,41 @@
+"""media objects
+
+Revision ID: c6f1d8a3e920
+Revises: 5d3b8f1e7a62
+Create Date: 2026-10-17 18:42:31.508216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1d8a3e920'
+down_revision: Union[str, Sequence[str], None] = '5d3b8f1e7a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('media_objects',
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('mime', sa.String(), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('unreferenced_since', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_media_objects_sha256'), 'media_objects', ['sha256'], unique=False)
+    op.create_index('ix_media_objects_unreferenced', 'media_objects', ['unreferenced_since'], unique=False, postgresql_where=sa.text('ref_count = 0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_media_objects_unreferenced', table_name='media_objects', postgresql_where=sa.text('ref_count = 0'))
+    op.drop_index(op.f('ix_media_objects_sha256'), table_name='media_objects')
+    op.drop_table('media_objects')
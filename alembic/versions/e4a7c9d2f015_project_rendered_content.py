@@ -0,0 +1,62 @@
+"""project rendered content
+
+Revision ID: e4a7c9d2f015
+Revises: b91d4e6f2a58
+Create Date: 2026-10-17 13:02:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.markdown import content_hash, render_markdown
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c9d2f015'
+down_revision: Union[str, Sequence[str], None] = 'b91d4e6f2a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('project_translations', sa.Column('content_html', sa.Text(), nullable=True))
+    op.add_column('project_translations', sa.Column('content_toc', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('project_translations', sa.Column('reading_minutes', sa.Integer(), nullable=True))
+    op.add_column('project_translations', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # backfill existing translations
+    translations = sa.table(
+        'project_translations',
+        sa.column('id', sa.Integer),
+        sa.column('content_markdown', sa.String),
+        sa.column('content_html', sa.Text),
+        sa.column('content_toc', postgresql.JSONB),
+        sa.column('reading_minutes', sa.Integer),
+        sa.column('content_hash', sa.String),
+    )
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(translations.c.id, translations.c.content_markdown)).all()
+    for row in rows:
+        rendered = render_markdown(row.content_markdown)
+        conn.execute(
+            translations.update()
+            .where(translations.c.id == row.id)
+            .values(
+                content_html=rendered.html,
+                content_toc=rendered.toc,
+                reading_minutes=rendered.reading_minutes,
+                content_hash=content_hash(row.content_markdown),
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('project_translations', 'content_hash')
+    op.drop_column('project_translations', 'reading_minutes')
+    op.drop_column('project_translations', 'content_toc')
+    op.drop_column('project_translations', 'content_html')
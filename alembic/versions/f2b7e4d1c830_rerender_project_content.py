@@ -0,0 +1,72 @@
+"""re-render project content
+
+Revision ID: f2b7e4d1c830
+Revises: c6f1d8a3e920
+Create Date: 2026-10-17 21:14:09.337516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.markdown import content_hash, render_markdown
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7e4d1c830'
+down_revision: Union[str, Sequence[str], None] = 'c6f1d8a3e920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # renders stored by an older RENDERER_VERSION (unrestricted table cell styles, duplicate heading ids)
+    translations = sa.table(
+        'project_translations',
+        sa.column('id', sa.Integer),
+        sa.column('content_markdown', sa.String),
+        sa.column('content_html', sa.Text),
+        sa.column('content_toc', postgresql.JSONB),
+        sa.column('reading_minutes', sa.Integer),
+        sa.column('content_hash', sa.String),
+    )
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(translations.c.id, translations.c.content_markdown, translations.c.content_hash)
+    ).all()
+    for row in rows:
+        digest = content_hash(row.content_markdown)
+        if row.content_hash == digest:
+            continue
+        rendered = render_markdown(row.content_markdown)
+        conn.execute(
+            translations.update()
+            .where(translations.c.id == row.id)
+            .values(
+                content_html=rendered.html,
+                content_toc=rendered.toc,
+                reading_minutes=rendered.reading_minutes,
+                content_hash=digest,
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE project_cards c
+        SET content_html = t.content_html, content_toc = t.content_toc, reading_minutes = t.reading_minutes
+        FROM project_translations t
+        WHERE t.project_id = c.project_id AND t.lang = c.lang
+          AND c.content_html IS DISTINCT FROM t.content_html
+        """
+    )
+    # cached responses and ETags were built from the old HTML
+    op.execute("UPDATE content_versions SET version = version + 1, updated_at = now() WHERE scope = 'projects'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # the old renders are not kept; the new ones stay valid
+    pass
@@ -1,4 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from app.api.deps import require_admin
+from app.core.response_cache import response_cache
+from app.db.pool import pool_status
+from app.db.replicas import replicas
+from app.db.session import async_engine
+from app.modules.projects.catalog import catalog
 from app.schemas.common import ApiResponse
 
 router = APIRouter(tags=["health"])
@@ -6,3 +12,21 @@ router = APIRouter(tags=["health"])
 @router.get("/health", response_model=ApiResponse[dict])
 async def health():
     return ApiResponse(data={"status": "ok"})
+
+@router.get("/health/cache", response_model=ApiResponse[dict])
+async def health_cache():
+    snapshot = catalog.current()
+    return ApiResponse(data={
+        "responses": response_cache.stats(),
+        "catalog": {
+            "enabled": catalog.enabled,
+            "loaded": snapshot is not None,
+            "entries": len(snapshot) if snapshot is not None else 0,
+            "versions": {scope: v.version for scope, v in snapshot.versions.items()} if snapshot is not None else {},
+        },
+    })
+
+@router.get("/health/pool", response_model=ApiResponse[dict], dependencies=[Depends(require_admin)])
+async def health_pool():
+    """Pool config, live usage and since-start peaks of this worker; size pools from peak_checked_out and waits."""
+    return ApiResponse(data={**pool_status(async_engine), "replication": replicas.status()})
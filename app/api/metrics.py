@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Response
+
+from app.core.metrics import CONTENT_TYPE, registry
+from app.db.pool import pool_stats
+from app.db.session import async_engine
+from app.modules.projects.catalog import catalog
+
+router = APIRouter(tags=["metrics"])
+
+
+def _pool(attr: str):
+    def collect():
+        pool = async_engine.pool
+        method = getattr(pool, attr, None)
+        return [((), method())] if method is not None else []
+    return collect
+
+
+registry.gauge_callback("db_pool_size", "Configured number of persistent connections.", _pool("size"))
+registry.gauge_callback("db_pool_checked_out", "Connections currently lent out.", _pool("checkedout"))
+registry.gauge_callback("db_pool_checked_in", "Idle connections in the pool.", _pool("checkedin"))
+registry.gauge_callback("db_pool_overflow", "Connections beyond pool_size (negative: not yet opened).", _pool("overflow"))
+registry.counter_callback("db_pool_busy_seconds_total", "Connection-seconds spent checked out of the pool.", lambda: [((), pool_stats.busy_seconds)])
+registry.gauge_callback("db_pool_peak_checked_out", "Most connections lent out at once since start.", lambda: [((), pool_stats.peak_checked_out)])
+registry.gauge_callback(
+    "catalog_entries",
+    "(slug, lang) entries in the in-memory catalog snapshot.",
+    lambda: [((), len(catalog.snapshot) if catalog.snapshot is not None else 0)],
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    # rendering reads in-memory numbers only, so it never waits on the database
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -2,6 +2,7 @@
 from fastapi import APIRouter
 from app.modules.projects.router import router as projects_router
 from app.modules.tags.router import router as tags_router
+from app.modules.search.router import router as search_router
 from app.api.health import router as health_router
 from app.api.v1.auth import router as auth_router
 from app.modules.media.router import router as media_router
@@ -10,6 +11,7 @@ api_router = APIRouter()
 
 api_router.include_router(projects_router)
 api_router.include_router(tags_router)
+api_router.include_router(search_router)
 api_router.include_router(health_router)
 api_router.include_router(auth_router)
 api_router.include_router(media_router)
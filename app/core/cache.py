@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Set, Tuple
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache; entries also expire after `ttl` seconds.
+    Entries can be registered under dependency tags so writers evict only what they affect.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._deps: Dict[str, Set[Hashable]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, deps: Iterable[str] = ()) -> None:
+        if self.ttl <= 0:
+            return
+        self._remove(key)
+        while len(self._data) >= self.maxsize:
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+        deps = tuple(deps)
+        self._data[key] = (time.monotonic() + self.ttl, value, deps)
+        for dep in deps:
+            self._deps.setdefault(dep, set()).add(key)
+
+    def delete(self, key: Hashable) -> None:
+        self._remove(key)
+
+    def evict(self, *deps: str) -> int:
+        """Drop every entry registered under any of `deps`; returns how many went."""
+        removed = 0
+        for dep in deps:
+            for key in self._deps.pop(dep, ()):
+                if key in self._data:
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._deps.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        for dep in entry[2]:
+            keys = self._deps.get(dep)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._deps[dep]
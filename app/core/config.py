@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,6 +16,45 @@ class Settings():
         self.JWT_EXPIRE_MINUTES = int(os.environ.get("JWT_EXPIRE_MINUTES", 60))
         self.ADMIN_USERNAME = os.environ.get("ADMIN_USERNAME")
         self.ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD")
+        self.COUNT_CACHE_TTL_SECONDS = float(os.environ.get("COUNT_CACHE_TTL_SECONDS", 30))
+        self.TAG_INDEX_ENABLED = os.environ.get("TAG_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.TAG_INDEX_TTL_SECONDS = float(os.environ.get("TAG_INDEX_TTL_SECONDS", 300))
+        self.RESPONSE_CACHE_ENABLED = os.environ.get("RESPONSE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", 30))
+        self.RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+        self.VERSION_CACHE_TTL_SECONDS = float(os.environ.get("VERSION_CACHE_TTL_SECONDS", 1))
+        self.CATALOG_ENABLED = os.environ.get("CATALOG_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.CATALOG_POLL_SECONDS = float(os.environ.get("CATALOG_POLL_SECONDS", 5))
+        self.FAST_RESPONSES_ENABLED = os.environ.get("FAST_RESPONSES_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.REQUEST_METRICS_ENABLED = os.environ.get("REQUEST_METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING_ENABLED", "true").lower() in ("1", "true", "yes")
+        # warn when one request issues more statements than this; 0 disables the check
+        self.SQL_QUERY_BUDGET = int(os.environ.get("SQL_QUERY_BUDGET", 0))
+        self.DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+        self.DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+        self.DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 30))
+        self.DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+        # always: ping on every checkout; idle: only after DB_POOL_PRE_PING_IDLE_SECONDS unused; never
+        self.DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "idle").lower()
+        self.DB_POOL_PRE_PING_IDLE_SECONDS = float(os.environ.get("DB_POOL_PRE_PING_IDLE_SECONDS", 60))
+        # asyncpg prepared statements kept per connection; 0 for pgbouncer in transaction mode
+        self.DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+        # server-side statement_timeout for every pooled connection; 0 = no limit
+        self.DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 0))
+        # GET routes run each statement in autocommit: no BEGIN/ROLLBACK round trips around reads
+        self.READ_SESSIONS_AUTOCOMMIT = os.environ.get("READ_SESSIONS_AUTOCOMMIT", "true").lower() in ("1", "true", "yes")
+        # comma-separated asyncpg URLs; public GET routes read from these round-robin
+        self.DATABASE_REPLICA_URLS = [u.strip() for u in os.environ.get("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+        self.REPLICA_CHECK_SECONDS = float(os.environ.get("REPLICA_CHECK_SECONDS", 5))
+        # capped at READ_YOUR_WRITES_SECONDS: a replica further behind would serve a writer its pre-write data
+        self.REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", 5))
+        self.READ_YOUR_WRITES_SECONDS = float(os.environ.get("READ_YOUR_WRITES_SECONDS", 5))
+        self.METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+        # served at /uploads; relative paths resolve against the project root, not the working directory
+        self.UPLOAD_DIR = Path(__file__).resolve().parents[2] / os.environ.get("UPLOAD_DIR", "uploads")
+        self.UPLOAD_MAX_MB = int(os.environ.get("UPLOAD_MAX_MB", 5))
+        # unreferenced uploads are kept this long before app.scripts.media_gc removes them
+        self.MEDIA_GC_GRACE_SECONDS = float(os.environ.get("MEDIA_GC_GRACE_SECONDS", 86400))
 
 
         if not self.DATABASE_URL_ASYNC:
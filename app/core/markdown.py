@@ -0,0 +1,80 @@
+import hashlib
+import math
+import re
+import unicodedata
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import nh3
+from markdown_it import MarkdownIt
+
+WORDS_PER_MINUTE = 200
+TOC_LEVELS = (2, 3)
+# part of content_hash: bumping it makes stored renders stale (re-rendered on the next write or by a migration)
+RENDERER_VERSION = 2
+
+# CommonMark + the GFM bits the client used through remark-gfm
+_md = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+
+_ALLOWED_ATTRIBUTES: Dict[str, set] = {tag: set(attrs) for tag, attrs in nh3.ALLOWED_ATTRIBUTES.items()}
+for _tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+    _ALLOWED_ATTRIBUTES.setdefault(_tag, set()).add("id")
+_ALLOWED_ATTRIBUTES.setdefault("code", set()).add("class")
+# table column alignment; every other CSS property is stripped from these
+_ALLOWED_ATTRIBUTES.setdefault("th", set()).add("style")
+_ALLOWED_ATTRIBUTES.setdefault("td", set()).add("style")
+_ALLOWED_STYLE_PROPERTIES = {"text-align"}
+
+
+class Rendered(NamedTuple):
+    html: str
+    toc: List[dict]
+    reading_minutes: int
+
+
+def content_hash(markdown: Optional[str]) -> str:
+    return hashlib.sha256(f"{RENDERER_VERSION}:{markdown or ''}".encode()).hexdigest()
+
+
+def _slugify(text: str) -> str:
+    # keep letters from any script, so Vietnamese headings still get readable anchors
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = re.sub(r"[^\w\s-]", "", text)
+    return re.sub(r"[\s_-]+", "-", text).strip("-") or "section"
+
+
+def _plain(token) -> str:
+    return "".join(c.content for c in token.children or () if c.type in ("text", "code_inline"))
+
+
+def render_markdown(markdown: Optional[str]) -> Rendered:
+    """Sanitized HTML with heading anchors, the h2/h3 outline and a reading-time estimate."""
+    tokens = _md.parse(markdown or "")
+
+    toc: List[dict] = []
+    used: Set[str] = set()
+    words = 0
+    for i, token in enumerate(tokens):
+        if token.type == "heading_open":
+            text = _plain(tokens[i + 1])
+            base = anchor = _slugify(text)
+            n = 0
+            # against every id handed out so far: "A", "A", "a-1" -> a, a-1, a-1-1
+            while anchor in used:
+                n += 1
+                anchor = f"{base}-{n}"
+            used.add(anchor)
+            token.attrSet("id", anchor)
+            level = int(token.tag[1])
+            if level in TOC_LEVELS:
+                toc.append({"level": level, "id": anchor, "text": text})
+        elif token.type == "inline":
+            words += len(_plain(token).split())
+        elif token.type in ("fence", "code_block"):
+            words += len(token.content.split())
+
+    html = nh3.clean(
+        _md.renderer.render(tokens, _md.options, {}),
+        attributes=_ALLOWED_ATTRIBUTES,
+        filter_style_properties=_ALLOWED_STYLE_PROPERTIES,
+    )
+    return Rendered(html=html, toc=toc, reading_minutes=max(1, math.ceil(words / WORDS_PER_MINUTE)))
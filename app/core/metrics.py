@@ -0,0 +1,185 @@
+"""
+In-process metrics, rendered in the Prometheus text exposition format (0.0.4) by GET /metrics.
+
+Counters and histograms are plain dict updates made on the event loop thread: no locks, no I/O.
+Gauges and cache counters are read through callbacks at scrape time, so they cost nothing in between.
+"""
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.cache import TTLCache
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[LabelValues, float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)) + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+
+    def lines(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self.lines()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def lines(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labels, lv)} {_number(v)}" for lv, v in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (last = +Inf, not cumulative), sum, count]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        state = self._values.get(label_values)
+        if state is None:
+            state = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def lines(self) -> List[str]:
+        names = (*self.labels, "le")
+        out: List[str] = []
+        for lv, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts):
+                cumulative += n
+                out.append(f"{self.name}_bucket{_labels(names, (*lv, _number(bound)))} {cumulative}")
+            out.append(f"{self.name}_sum{_labels(self.labels, lv)} {_number(total)}")
+            out.append(f"{self.name}_count{_labels(self.labels, lv)} {count}")
+        return out
+
+    def quantile(self, q: float, *label_values: str) -> Optional[float]:
+        """Estimate like PromQL histogram_quantile: linear within the bucket the rank falls in."""
+        state = self._values.get(label_values)
+        if state is None or state[2] == 0:
+            return None
+        rank = q * state[2]
+        cumulative = 0
+        lower = 0.0
+        for bound, n in zip(self.buckets, state[0]):
+            if n and cumulative + n >= rank:
+                return lower + (bound - lower) * (rank - cumulative) / n
+            cumulative += n
+            lower = bound
+        return self.buckets[-1]  # in the +Inf bucket: the largest finite bound is all we know
+
+    def summary(self, *label_values: str) -> Dict[str, Optional[float]]:
+        state = self._values.get(label_values)
+        count = state[2] if state is not None else 0
+        return {
+            "count": count,
+            "mean": state[1] / count if count else None,
+            "p50": self.quantile(0.5, *label_values),
+            "p95": self.quantile(0.95, *label_values),
+            "p99": self.quantile(0.99, *label_values),
+        }
+
+
+class _Callback(_Metric):
+    def __init__(self, kind: str, name: str, help: str, labels: Sequence[str], collect: Callable[[], Iterable[Sample]]):
+        super().__init__(name, help, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def lines(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labels, lv)} {_number(v)}" for lv, v in self.collect()]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._caches: Dict[str, TTLCache] = {}
+
+    def _add(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def gauge_callback(self, name: str, help: str, collect: Callable[[], Iterable[Sample]], labels: Sequence[str] = ()) -> None:
+        self._add(_Callback("gauge", name, help, labels, collect))
+
+    def counter_callback(self, name: str, help: str, collect: Callable[[], Iterable[Sample]], labels: Sequence[str] = ()) -> None:
+        self._add(_Callback("counter", name, help, labels, collect))
+
+    def register_cache(self, name: str, cache: TTLCache) -> None:
+        """Expose a TTLCache's hit/miss/eviction counters and size under cache="<name>"."""
+        self._caches[name] = cache
+
+    def _cache_samples(self, attr: str) -> Iterable[Sample]:
+        return [((name,), getattr(cache, attr)) for name, cache in sorted(self._caches.items())]
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+registry.counter_callback("cache_hits_total", "Cache lookups that found a live entry.", lambda: registry._cache_samples("hits"), ("cache",))
+registry.counter_callback("cache_misses_total", "Cache lookups that found nothing or an expired entry.", lambda: registry._cache_samples("misses"), ("cache",))
+registry.counter_callback("cache_evictions_total", "Entries dropped because the cache was full.", lambda: registry._cache_samples("evictions"), ("cache",))
+registry.gauge_callback("cache_entries", "Entries currently held.", lambda: [((n,), len(c)) for n, c in sorted(registry._caches.items())], ("cache",))
+
+HTTP_REQUESTS = registry.counter("http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"))
+HTTP_DURATION = registry.histogram("http_request_duration_seconds", "Time until the response was fully sent.", ("method", "route"))
+DB_STATEMENTS = registry.counter("db_statements_total", "SQL statements executed while serving requests.", ("method", "route"))
+DB_POOL_WAIT = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time to obtain a pooled connection, including opening a new one.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+DB_POOL_TIMEOUTS = registry.counter("db_pool_timeouts_total", "Checkouts that gave up after pool_timeout with the pool exhausted.")
+UPLOAD_BYTES = registry.counter("upload_bytes_total", "Bytes of uploaded media written to storage.")
+UPLOADS = registry.counter("uploads_total", "Upload requests by outcome.", ("outcome",))
@@ -0,0 +1,67 @@
+import json
+from typing import Any, AsyncIterator, List, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+# openapi_extra for routes that read an NDJSON request body themselves
+NDJSON_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/x-ndjson": {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
+
+
+def _decode(raw: bytes) -> Any:
+    try:
+        return json.loads(raw)
+    except ValueError as e:  # JSONDecodeError and UnicodeDecodeError
+        return ValueError(f"invalid JSON: {e}")
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Any]]:
+    """(1-based line number, decoded value or ValueError) for every non-blank line, as the body arrives."""
+    buf = bytearray()
+    line_no = 0
+    async for chunk in chunks:
+        buf.extend(chunk)
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            line_no += 1
+            raw = bytes(buf[start:end]).strip()
+            if raw:
+                yield line_no, _decode(raw)
+            start = end + 1
+        del buf[:start]
+    if bytes(buf).strip():
+        yield line_no + 1, _decode(bytes(buf).strip())
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc']) or 'body'}: {e['msg']}" for e in exc.errors())
+
+
+async def validated(lines: AsyncIterator[Tuple[int, Any]], model: Type[M]) -> AsyncIterator[Tuple[int, Union[M, str]]]:
+    """iter_ndjson() output validated against `model`; failures become an error message."""
+    async for line_no, value in lines:
+        if isinstance(value, ValueError):
+            yield line_no, str(value)
+            continue
+        try:
+            yield line_no, model.model_validate(value)
+        except ValidationError as e:
+            yield line_no, _describe(e)
+
+
+async def batched(items: AsyncIterator[T], size: int) -> AsyncIterator[List[T]]:
+    batch: List[T] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
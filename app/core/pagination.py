@@ -0,0 +1,28 @@
+import base64
+import json
+from datetime import datetime
+from typing import Literal, Optional, Tuple
+
+CursorDirection = Literal["next", "prev"]
+
+
+def encode_cursor(published_at: Optional[datetime], id_: int, direction: CursorDirection = "next") -> str:
+    raw = json.dumps(
+        {"p": published_at.isoformat() if published_at else None, "i": id_, "d": direction},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int, CursorDirection]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        published_at = datetime.fromisoformat(data["p"]) if data["p"] else None
+        id_ = int(data["i"])
+        direction = data.get("d", "next")
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("invalid cursor")
+    if direction not in ("next", "prev"):
+        raise ValueError("invalid cursor")
+    return published_at, id_, direction
@@ -0,0 +1,131 @@
+"""
+Per-request database instrumentation.
+
+Engine events add every statement's count, rows and duration to the stats of the request being served
+(a ContextVar set by RequestMetricsMiddleware). The middleware sends them back as a Server-Timing header,
+writes one log line per request and, with SQL_QUERY_BUDGET set, warns about routes issuing more statements.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import DB_STATEMENTS, HTTP_DURATION, HTTP_REQUESTS
+
+logger = logging.getLogger("app.requests")
+
+
+class RequestStats:
+    __slots__ = ("queries", "rows", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.rows = 0
+        self.db_seconds = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the statement counters to a (sync) engine; async engines pass `.sync_engine`."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        stats = _current.get()
+        if stats is None:
+            return
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+        if cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # after_cursor_execute does not run for a failed statement
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+
+def server_timing(stats: RequestStats, app_seconds: float) -> str:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries, {stats.rows} rows", '
+        f"app;dur={app_seconds * 1000:.2f}"
+    )
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI, so the header can be added without buffering the response body."""
+
+    def __init__(self, app, query_budget: int = 0, server_timing_header: bool = True):
+        self.app = app
+        self.query_budget = query_budget
+        self.server_timing_header = server_timing_header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing_header:
+                    # streamed bodies keep querying after this point; the log line has the full numbers
+                    value = server_timing(stats, time.perf_counter() - started)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", value.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self._report(scope, status, stats, time.perf_counter() - started)
+
+    def _report(self, scope, status: int, stats: RequestStats, seconds: float) -> None:
+        route = getattr(scope.get("route"), "path", None)
+        path = route or scope["path"]
+        # raw paths of unmatched requests would give every 404 its own series
+        label = route or "unmatched"
+        HTTP_REQUESTS.inc(scope["method"], label, str(status))
+        HTTP_DURATION.observe(seconds, scope["method"], label)
+        if stats.queries:
+            DB_STATEMENTS.inc(scope["method"], label, amount=stats.queries)
+        logger.info(
+            "method=%s route=%s status=%d duration_ms=%.2f db_queries=%d db_rows=%d db_ms=%.2f",
+            scope["method"], path, status, seconds * 1000, stats.queries, stats.rows, stats.db_seconds * 1000,
+            extra={
+                "method": scope["method"],
+                "route": path,
+                "status": status,
+                "duration_ms": round(seconds * 1000, 2),
+                "db_queries": stats.queries,
+                "db_rows": stats.rows,
+                "db_ms": round(stats.db_seconds * 1000, 2),
+            },
+        )
+        if self.query_budget and stats.queries > self.query_budget:
+            logger.warning(
+                "query budget exceeded: %s %s issued %d statements (budget %d)",
+                scope["method"], path, stats.queries, self.query_budget,
+            )
+
@@ -0,0 +1,42 @@
+from typing import Any, Hashable, Iterable, List, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import registry
+
+# dependency tags used by the public read routes; repositories evict by these after commit
+PROJECTS_LIST = "projects:list"
+TAGS_LIST = "tags:list"
+
+
+def project_dep(slug: str) -> str:
+    return f"project:{slug}"
+
+
+def tag_dep(tag_id: int) -> str:
+    return f"tag:{tag_id}"
+
+
+response_cache = TTLCache(
+    maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS if settings.RESPONSE_CACHE_ENABLED else 0,
+)
+registry.register_cache("responses", response_cache)
+
+
+def cache_key(route: str, **params: Any) -> Tuple[Hashable, ...]:
+    """Route + query params, normalized so equivalent requests share one entry."""
+    parts: List[Tuple[str, Hashable]] = []
+    for name, value in sorted(params.items()):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, (list, tuple, set)):
+            value = tuple(sorted(set(value)))
+        parts.append((name, value))
+    return (route, *parts)
+
+
+def tag_deps(tag_ids: Iterable[int]) -> List[str]:
+    return [tag_dep(tid) for tid in set(tag_ids)]
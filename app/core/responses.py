@@ -0,0 +1,27 @@
+from typing import Any, Optional
+
+from fastapi import Response
+
+from app.core.config import settings
+from app.schemas.common import ApiResponse
+
+
+def api_response(data: Any, response: Optional[Response] = None) -> Any:
+    """
+    ApiResponse(data=data) serialized straight to JSON bytes by pydantic-core.
+    `data` must already be a valid model (from a repository, the catalog or a cache): returning a
+    Response skips both ApiResponse validation and FastAPI's response_model round-trip, while the
+    route's response_model still documents the schema.
+    """
+    if not settings.FAST_RESPONSES_ENABLED:
+        return ApiResponse(data=data)
+    out = Response(
+        content=ApiResponse.model_construct(data=data).model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
+    # headers set on the injected Response (ETag etc.) are only merged for non-Response returns
+    if response is not None:
+        for name, value in response.headers.items():
+            if name != "content-length":
+                out.headers[name] = value
+    return out
@@ -1,6 +1,30 @@
+import math
 from typing import AsyncGenerator
-from fastapi import Depends
+from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.session import get_async_session
+from app.core.config import settings
+from app.db.replicas import READ_PRIMARY_COOKIE, replicas
+from app.db.session import async_read_session_factory, async_session_factory
 
-get_db = get_async_session
\ No newline at end of file
+
+async def get_db(request: Request, response: Response) -> AsyncGenerator[AsyncSession, None]:
+    """Primary session, for writes and admin reads."""
+    if replicas.replicas and request.method not in ("GET", "HEAD", "OPTIONS"):
+        # this client's next reads skip the replicas until they have caught up
+        response.set_cookie(
+            READ_PRIMARY_COOKIE, "1",
+            max_age=max(1, math.ceil(settings.READ_YOUR_WRITES_SECONDS)), httponly=True, samesite="lax",
+        )
+    async with async_session_factory() as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Public reads: a healthy replica in round-robin order, else the primary; autocommit, see read_session_factory."""
+    replica = replicas.pick(read_primary=READ_PRIMARY_COOKIE in request.cookies)
+    factory = replica.session_factory if replica is not None else async_read_session_factory
+    async with factory() as session:
+        if replica is not None:
+            # may be behind this worker's caches; see app.db.versions.reads_are_current
+            session.info["replica"] = replica.name
+        yield session
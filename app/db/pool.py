@@ -0,0 +1,128 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.metrics import DB_POOL_TIMEOUTS, DB_POOL_WAIT
+
+PRE_PING_STRATEGIES = ("always", "idle", "never")
+
+
+class PoolStats:
+    """Counters the pool itself does not keep; read by /health/pool and /metrics."""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.checkouts = 0
+        self.busy_seconds = 0.0  # connection-seconds spent checked out; / wall time = mean occupancy
+        self.peak_checked_out = 0
+        self.timeouts = 0
+        self.pings = 0
+        self.ping_failures = 0
+
+
+pool_stats = PoolStats()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """The default asyncpg pool, recording how long each checkout waited (db_pool_wait_seconds)."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def engine_options() -> Dict[str, Any]:
+    """create_async_engine() keyword arguments from the DB_* settings."""
+    if settings.DB_POOL_PRE_PING not in PRE_PING_STRATEGIES:
+        raise RuntimeError(f"DB_POOL_PRE_PING must be one of {', '.join(PRE_PING_STRATEGIES)}")
+
+    connect_args: Dict[str, Any] = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+        "connect_args": connect_args,
+    }
+
+
+def instrument_pool(engine: AsyncEngine, stats: PoolStats = pool_stats) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkouts += 1
+        connection_record.info["checked_out_at"] = time.monotonic()
+        stats.peak_checked_out = max(stats.peak_checked_out, sync_engine.pool.checkedout())
+
+        if settings.DB_POOL_PRE_PING != "idle":
+            return
+        checked_in_at = connection_record.info.get("checked_in_at")
+        # only connections that sat idle long enough to be dropped by a proxy/firewall/server pay the round trip
+        if checked_in_at is None or time.monotonic() - checked_in_at < settings.DB_POOL_PRE_PING_IDLE_SECONDS:
+            return
+        stats.pings += 1
+        try:
+            dbapi_connection.ping()
+        except Exception as e:
+            stats.ping_failures += 1
+            # the pool discards this connection and retries the checkout with a fresh one
+            raise exc.DisconnectionError() from e
+
+    @event.listens_for(sync_engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        now = time.monotonic()
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            stats.busy_seconds += now - checked_out_at
+        connection_record.info["checked_in_at"] = now
+
+
+def pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.pool
+    checked_out = pool.checkedout()
+    return {
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pre_ping": settings.DB_POOL_PRE_PING,
+            "pre_ping_idle_seconds": settings.DB_POOL_PRE_PING_IDLE_SECONDS,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+        },
+        "live": {
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "open": checked_out + pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "capacity": settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+        },
+        "since_start": {
+            "seconds": round(time.time() - pool_stats.started_at, 1),
+            "checkouts": pool_stats.checkouts,
+            "peak_checked_out": pool_stats.peak_checked_out,
+            "busy_seconds": round(pool_stats.busy_seconds, 3),
+            "timeouts": pool_stats.timeouts,
+            "pings": pool_stats.pings,
+            "ping_failures": pool_stats.ping_failures,
+            "wait_seconds": DB_POOL_WAIT.summary(),
+        },
+    }
@@ -0,0 +1,150 @@
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import suppress
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+from app.core.request_metrics import instrument_engine
+from app.db.pool import PoolStats, engine_options, instrument_pool
+from app.db.session import async_engine, read_session_factory
+
+logger = logging.getLogger(__name__)
+
+# seconds the replica is behind; 0 once it has replayed everything received (the last replayed commit of an
+# idle primary can be any age) and on a primary (e.g. a second standalone instance used for testing)
+_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+# set on responses to mutating requests; while present, that client's reads go to the primary
+READ_PRIMARY_COOKIE = "read_primary"
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.engine: AsyncEngine = create_async_engine(url, future=True, echo=False, **engine_options())
+        self.session_factory = read_session_factory(self.engine)
+        self.stats = PoolStats()
+        self.name = self.engine.url.render_as_string(hide_password=True)
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.error: Optional[str] = None
+        instrument_pool(self.engine, self.stats)
+        if settings.REQUEST_METRICS_ENABLED:
+            instrument_engine(self.engine.sync_engine)
+
+    async def _lag(self) -> float:
+        async with self.engine.connect() as conn:
+            return float((await conn.execute(_LAG_SQL)).scalar_one())
+
+    async def check(self, timeout: float, max_lag: float) -> None:
+        try:
+            lag = await asyncio.wait_for(self._lag(), timeout)
+        except Exception as e:
+            if self.healthy:
+                logger.warning("replica %s is down, reads fall back: %s", self.name, e)
+            self.healthy, self.lag, self.error = False, None, str(e) or type(e).__name__
+            return
+        self.lag = lag
+        self.error = None
+        healthy = not max_lag or lag <= max_lag
+        if healthy != self.healthy:
+            logger.warning("replica %s %s (lag %.1fs)", self.name, "is up" if healthy else "lags too far", lag)
+        self.healthy = healthy
+
+    def status(self) -> dict:
+        pool = self.engine.pool
+        return {
+            "url": self.name,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "error": self.error,
+            "checked_out": pool.checkedout(),
+            "peak_checked_out": self.stats.peak_checked_out,
+        }
+
+
+class ReplicaSet:
+    """
+    Round-robin read sessions over the healthy replicas, falling back to the primary.
+    A background task health-checks every replica (connectivity and replay lag).
+    """
+
+    def __init__(self, urls: List[str], check_interval: float, max_lag: float, read_your_writes: float):
+        self.replicas = [Replica(url) for url in urls]
+        self.check_interval = check_interval
+        if read_your_writes and (not max_lag or max_lag > read_your_writes):
+            # once the window closes the writer reads from the replicas again: they must have caught up by then
+            if urls:
+                logger.warning("REPLICA_MAX_LAG_SECONDS capped at READ_YOUR_WRITES_SECONDS (%s)", read_your_writes)
+            max_lag = read_your_writes
+        self.max_lag = max_lag
+        self.read_your_writes = read_your_writes
+        self.last_primary_commit = 0.0
+        self._rr = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+        @event.listens_for(async_engine.sync_engine, "commit")
+        def _on_commit(conn):
+            self.last_primary_commit = time.monotonic()
+
+    def _recent_write(self) -> bool:
+        return time.monotonic() - self.last_primary_commit < self.read_your_writes
+
+    def pick(self, read_primary: bool = False) -> Optional[Replica]:
+        """A healthy replica, or None when the read must go to the primary."""
+        if read_primary or self._recent_write():
+            return None
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._rr) % len(healthy)]
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(r.check(self.check_interval, self.max_lag) for r in self.replicas))
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self.check_all()
+            except Exception:
+                logger.exception("replica health check failed")
+
+    async def start(self) -> None:
+        if not self.replicas:
+            return
+        await self.check_all()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for r in self.replicas:
+            await r.engine.dispose()
+
+    def status(self) -> dict:
+        return {
+            "read_your_writes_seconds": self.read_your_writes,
+            "max_lag_seconds": self.max_lag,
+            "recent_write": self._recent_write(),
+            "replicas": [r.status() for r in self.replicas],
+        }
+
+
+replicas = ReplicaSet(
+    urls=settings.DATABASE_REPLICA_URLS,
+    check_interval=settings.REPLICA_CHECK_SECONDS,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    read_your_writes=settings.READ_YOUR_WRITES_SECONDS,
+)
@@ -1,12 +1,34 @@
 from collections.abc import AsyncGenerator
 from app.core.config import settings
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from app.core.request_metrics import instrument_engine
+from app.db.pool import engine_options, instrument_pool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 
 DATABASE_URL = settings.DATABASE_URL_ASYNC
 
-async_engine = create_async_engine(DATABASE_URL, future=True, echo=False, pool_pre_ping=True)
+async_engine = create_async_engine(DATABASE_URL, future=True, echo=False, **engine_options())
+instrument_pool(async_engine)
+if settings.REQUEST_METRICS_ENABLED:
+    instrument_engine(async_engine.sync_engine)
 
 async_session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def read_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Sessions for read-only routes. Like every AsyncSession they check out a connection only on the first
+    statement, so requests answered from memory never touch the pool. In autocommit mode asyncpg also skips
+    the BEGIN before the first statement and the ROLLBACK when the session closes; under READ COMMITTED each
+    statement had its own snapshot anyway, so reads see nothing different. Never write through these.
+    """
+    if settings.READ_SESSIONS_AUTOCOMMIT:
+        engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async_read_session_factory = read_session_factory(async_engine)
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
-        yield session
\ No newline at end of file
+        yield session
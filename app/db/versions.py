@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.http_cache import make_etag
+from app.core.metrics import registry
+from app.models.content_version import ContentVersion
+
+PROJECTS = "projects"
+TAGS = "tags"
+
+
+class Version(NamedTuple):
+    version: int
+    updated_at: Optional[datetime]
+
+
+# other workers' bumps become visible after at most VERSION_CACHE_TTL_SECONDS
+_versions = TTLCache(maxsize=1, ttl=settings.VERSION_CACHE_TTL_SECONDS)
+registry.register_cache("content_versions", _versions)
+
+# highest version of each scope this worker has seen: its own bumps and every read (the catalog polls the primary)
+_latest: Dict[str, int] = {}
+
+
+def _observe(versions: Dict[str, int]) -> None:
+    for scope, version in versions.items():
+        if version > _latest.get(scope, 0):
+            _latest[scope] = version
+
+
+def is_current(versions: Dict[str, Version]) -> bool:
+    """Not older than anything this worker has seen, i.e. not read from a replica that is behind."""
+    return all(versions.get(scope, Version(0, None)).version >= latest for scope, latest in _latest.items())
+
+
+async def get_versions(db: AsyncSession) -> Dict[str, Version]:
+    versions = _versions.get("all")
+    if versions is None:
+        versions = await read_versions(db)
+        if is_current(versions):
+            _versions.set("all", versions)
+    return versions
+
+
+async def session_versions(db: AsyncSession) -> Dict[str, Version]:
+    """
+    The versions `db` reads content at. A replica session reads them itself, once and before any content
+    (autocommit: every later statement sees at least that much), so ETags match what it serves.
+    """
+    if "replica" not in db.info:
+        return await get_versions(db)
+    versions = db.info.get("versions")
+    if versions is None:
+        versions = db.info["versions"] = await read_versions(db)
+    return versions
+
+
+async def reads_are_current(db: AsyncSession) -> bool:
+    """Whether data read through `db` may go into the worker-wide caches; call before reading it."""
+    if "replica" not in db.info:
+        return True
+    return is_current(await session_versions(db))
+
+
+async def bump_versions(db: AsyncSession, *scopes: str) -> None:
+    """Call inside the writing transaction, before commit."""
+    rows = await db.execute(
+        update(ContentVersion)
+        .where(ContentVersion.scope.in_(scopes))
+        .values(version=ContentVersion.version + 1, updated_at=func.now())
+        .returning(ContentVersion.scope, ContentVersion.version)
+    )
+    # seen before the commit: a rollback only keeps replica reads out of the caches until the next bump
+    _observe({row.scope: row.version for row in rows})
+    _versions.clear()
+
+
+async def read_versions(db: AsyncSession) -> Dict[str, Version]:
+    rows = (await db.execute(select(ContentVersion.scope, ContentVersion.version, ContentVersion.updated_at))).all()
+    _observe({row.scope: row.version for row in rows})
+    return {row.scope: Version(row.version, row.updated_at) for row in rows}
+
+
+def version_tag(versions: Dict[str, Version], *scopes: str) -> str:
+    """
+    Part of every response cache key: cache evictions only reach the worker that wrote, so another worker
+    must not find a body cached before the write once its ETag says the content has moved on.
+    """
+    return ",".join(f"{scope}:{versions.get(scope, Version(0, None)).version}" for scope in scopes)
+
+
+def validators_for(versions: Dict[str, Version], key: Hashable, *scopes: str) -> Tuple[str, Optional[datetime]]:
+    """
+    (strong ETag, Last-Modified) for a response built from `scopes` as of `versions`.
+    Last-Modified is the newest bump of those scopes, not the served rows' updated_at: known without a query, and
+    never earlier than a real change to the response, only later than it would need to be.
+    """
+    current = [versions.get(scope, Version(0, None)) for scope in scopes]
+    etag = make_etag(key, *(v.version for v in current))
+    stamps = [v.updated_at for v in current if v.updated_at is not None]
+    return etag, max(stamps) if stamps else None
+
@@ -1,14 +1,27 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
-from pathlib import Path
+from app.api.metrics import router as metrics_router
+from app.core.config import settings
+from app.core.request_metrics import RequestMetricsMiddleware
+from app.db.replicas import replicas
+from app.modules.projects.catalog import catalog
 from fastapi.staticfiles import StaticFiles
 
-app = FastAPI()
 
-BASE_DIR = Path(__file__).resolve().parent
-UPLOAD_DIR = (BASE_DIR.parent / "uploads").resolve()
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await replicas.start()
+    await catalog.start()
+    yield
+    await catalog.stop()
+    await replicas.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,5 +36,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# added last so it wraps CORS too: Server-Timing covers the whole request
+if settings.REQUEST_METRICS_ENABLED:
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        query_budget=settings.SQL_QUERY_BUDGET,
+        server_timing_header=settings.SERVER_TIMING_ENABLED,
+    )
+
 app.include_router(api_router, prefix="/api/v1")
-app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+app.mount("/uploads", StaticFiles(directory=str(settings.UPLOAD_DIR)), name="uploads")
@@ -2,4 +2,7 @@ from .project import Project
 from .project_tag import ProjectTag
 from .project_translation import ProjectTranslation
 from .tag import Tag
-from .tag_translation import TagTranslation
\ No newline at end of file
+from .tag_translation import TagTranslation
+from .content_version import ContentVersion
+from .project_card import ProjectCard
+from .media_object import MediaObject
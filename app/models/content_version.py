@@ -0,0 +1,8 @@
+from app.db.base import Base
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+
+class ContentVersion(Base):
+    __tablename__ = "content_versions"
+    scope = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,19 @@
+from app.db.base import Base
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, func, text
+
+class MediaObject(Base):
+    """One stored upload: the file UPLOAD_DIR/<key>, where key = sha256 hex + extension."""
+    __tablename__ = "media_objects"
+    key = Column(String, primary_key=True)
+    sha256 = Column(String(64), nullable=False, index=True)
+    mime = Column(String, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    # projects whose cover or Markdown points at /uploads/<key>; kept by refresh_media_refs
+    ref_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # set while ref_count = 0; the GC removes the object once this is older than the grace period
+    unreferenced_since = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_media_objects_unreferenced", "unreferenced_since", postgresql_where=text("ref_count = 0")),
+    )
@@ -0,0 +1,36 @@
+from app.db.base import Base
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+
+class ProjectCard(Base):
+    """Read model: one row per (project, lang) with everything the public list/detail need."""
+    __tablename__ = "project_cards"
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    lang = Column(String, primary_key=True)
+    slug = Column(String, nullable=False)
+    cover_image_url = Column(String, nullable=True)
+    repo_url = Column(String, nullable=True)
+    demo_url = Column(String, nullable=True)
+    status = Column(String, nullable=False)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    title = Column(String, nullable=False)
+    summary = Column(String, nullable=True)
+    content_markdown = Column(String, nullable=True)
+    content_html = Column(Text, nullable=True)
+    content_toc = Column(JSONB, nullable=True)
+    reading_minutes = Column(Integer, nullable=True)
+    tags = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    tag_ids = Column(ARRAY(Integer), nullable=False, server_default=text("'{}'::integer[]"))
+    search_vector = Column(TSVECTOR, nullable=True)
+    __table_args__ = (
+        Index(
+            "ix_project_cards_listing",
+            "lang",
+            "status",
+            text("published_at DESC NULLS LAST"),
+            text("project_id DESC"),
+        ),
+        Index("ix_project_cards_slug_lang", "slug", "lang", unique=True),
+        Index("ix_project_cards_tag_ids", "tag_ids", postgresql_using="gin"),
+        Index("ix_project_cards_search_vector", "search_vector", postgresql_using="gin"),
+    )
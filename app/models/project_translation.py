@@ -1,7 +1,26 @@
 from app.db.base import Base
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Computed, Index, Integer, String, Text, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import relationship
 
+# text search config per translation lang; Postgres has no Vietnamese stemmer, so vi stays unstemmed
+SEARCH_CONFIGS = {"en": "english", "vi": "simple"}
+
+
+def _search_config_sql() -> str:
+    whens = " ".join(f"WHEN '{lang}' THEN '{cfg}'::regconfig" for lang, cfg in SEARCH_CONFIGS.items())
+    return f"CASE lang {whens} ELSE 'simple'::regconfig END"
+
+
+def search_vector_sql() -> str:
+    cfg = _search_config_sql()
+    return (
+        f"setweight(to_tsvector({cfg}, coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector({cfg}, coalesce(summary, '')), 'B') || "
+        f"setweight(to_tsvector({cfg}, coalesce(content_markdown, '')), 'C')"
+    )
+
+
 class ProjectTranslation(Base):
     __tablename__ = "project_translations"
     id = Column(Integer, primary_key=True, index=True)
@@ -10,5 +29,20 @@ class ProjectTranslation(Base):
     title = Column(String, nullable=False)
     summary = Column(String, nullable=False)
     content_markdown = Column(String, nullable=False)
-    __table_args__ = (UniqueConstraint('project_id', 'lang'),)
-    project = relationship("Project", back_populates="translations")
\ No newline at end of file
+    # rendered at write time from content_markdown; content_hash says which markdown they belong to
+    content_html = Column(Text, nullable=True)
+    content_toc = Column(JSONB, nullable=True)
+    reading_minutes = Column(Integer, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+    search_vector = Column(TSVECTOR, Computed(search_vector_sql(), persisted=True), nullable=True)
+    __table_args__ = (
+        UniqueConstraint('project_id', 'lang'),
+        Index("ix_project_translations_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_project_translations_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+    project = relationship("Project", back_populates="translations")
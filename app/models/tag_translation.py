@@ -1,5 +1,5 @@
 from app.db.base import Base
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Index, Integer, String, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 class TagTranslation(Base):
@@ -8,5 +8,13 @@ class TagTranslation(Base):
     tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
     lang = Column(String, nullable=False)
     name = Column(String, nullable=False)
-    __table_args__ = (UniqueConstraint('tag_id', 'lang'),)
+    __table_args__ = (
+        UniqueConstraint('tag_id', 'lang'),
+        Index(
+            "ix_tag_translations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
     tag = relationship("Tag", back_populates="tag_translations")
\ No newline at end of file
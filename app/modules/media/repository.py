@@ -0,0 +1,100 @@
+import re
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import case, delete, exists, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.media_object import MediaObject
+from app.models.project import Project
+from app.models.project_translation import ProjectTranslation
+from app.modules.media.upload import StoredUpload
+
+# "/uploads/<sha256>.<ext>" inside a cover URL (relative or absolute) or Markdown
+_KEY_RE = re.compile(r"/uploads/([0-9a-f]{64}\.[a-z0-9]+)")
+
+
+def media_keys(*texts: Optional[str]) -> Set[str]:
+    """Keys of content-addressed uploads referenced from cover URLs or Markdown."""
+    return {key for text in texts if text for key in _KEY_RE.findall(text)}
+
+
+def _references(name):
+    """Projects pointing at /uploads/<name> from their cover or from any translation's Markdown."""
+    path = literal("/uploads/") + name
+    in_markdown = exists().where(
+        ProjectTranslation.project_id == Project.id,
+        ProjectTranslation.content_markdown.contains(path),
+    )
+    return or_(Project.cover_image_url.endswith(path), in_markdown)
+
+
+def _ref_count():
+    return select(func.count(Project.id)).where(_references(MediaObject.key)).scalar_subquery()
+
+
+async def register_media(db: AsyncSession, upload: StoredUpload) -> None:
+    """Record an upload before its file gets the final name; re-uploading an unreferenced object restarts its grace period."""
+    stmt = insert(MediaObject).values(
+        key=upload.key,
+        sha256=upload.sha256,
+        mime=upload.content_type,
+        size=upload.size,
+        ref_count=0,
+        unreferenced_since=func.now(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MediaObject.key],
+        set_={"unreferenced_since": case((MediaObject.ref_count == 0, func.now()), else_=None)},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def refresh_media_refs(db: AsyncSession, keys: Optional[Iterable[str]] = None) -> None:
+    """Recount references to `keys` (all objects when None). Call inside the writing transaction, after the change."""
+    stmt = update(MediaObject)
+    if keys is not None:
+        keys = set(keys)
+        if not keys:
+            return
+        stmt = stmt.where(MediaObject.key.in_(keys))
+    refs = _ref_count()
+    await db.execute(
+        stmt.values(
+            ref_count=refs,
+            unreferenced_since=case((refs > 0, None), else_=func.coalesce(MediaObject.unreferenced_since, func.now())),
+        )
+    )
+
+
+async def lock_garbage(db: AsyncSession, before: datetime, limit: int) -> List[str]:
+    """
+    Keys unreferenced since before `before`, oldest first, re-checked against the projects and locked FOR UPDATE:
+    an upload of the same bytes waits in register_media until the caller has removed the file and committed.
+    """
+    rows = await db.execute(
+        select(MediaObject.key)
+        .where(MediaObject.ref_count == 0, MediaObject.unreferenced_since < before, _ref_count() == 0)
+        .order_by(MediaObject.unreferenced_since)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(rows.scalars().all())
+
+
+async def delete_media(db: AsyncSession, keys: Iterable[str]) -> None:
+    await db.execute(delete(MediaObject).where(MediaObject.key.in_(list(keys))))
+
+
+async def known_media(db: AsyncSession, names: Iterable[str]) -> Set[str]:
+    names = list(names)
+    if not names:
+        return set()
+    return set((await db.execute(select(MediaObject.key).where(MediaObject.key.in_(names)))).scalars().all())
+
+
+async def is_referenced(db: AsyncSession, name: str) -> bool:
+    """Any project pointing at /uploads/<name>; also covers files stored before media_objects existed."""
+    return bool((await db.execute(select(exists().where(_references(literal(name)))))).scalar())
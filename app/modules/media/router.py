@@ -1,25 +1,46 @@
-import os
-import uuid
-from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-router = APIRouter(prefix="/admin/media", tags=["media"])
-
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+from app.api.deps import require_admin
+from app.core.config import settings
+from app.core.metrics import UPLOAD_BYTES, UPLOADS
+from app.db.deps import get_db
+from app.schemas.common import ApiResponse
+from app.modules.media.repository import register_media
+from app.modules.media.schemas import UploadResult
+from app.modules.media.upload import UPLOAD_BODY, UploadTooLarge, receive_upload
 
-ALLOWED = {"image/jpeg", "image/png", "image/webp", "image/gif"}
-
-@router.post("/upload")
-async def upload(file: UploadFile = File(...)):
-    if file.content_type not in ALLOWED:
-        raise HTTPException(status_code=400, detail="Only image files are allowed")
+router = APIRouter(prefix="/admin/media", tags=["media"])
 
-    ext = Path(file.filename or "").suffix.lower() or ".jpg"
-    name = f"{uuid.uuid4().hex}{ext}"
-    path = UPLOAD_DIR / name
 
-    content = await file.read()
-    path.write_bytes(content)
+@router.post("/upload", response_model=ApiResponse[UploadResult], dependencies=[Depends(require_admin)], openapi_extra=UPLOAD_BODY)
+async def upload(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Multipart `file` field, an image up to UPLOAD_MAX_MB; streamed to disk, never buffered in memory.
+    Stored under its SHA-256, so the same bytes uploaded twice share one file and one URL.
+    """
+    try:
+        async with receive_upload(request, settings.UPLOAD_DIR, settings.UPLOAD_MAX_MB * 1024 * 1024) as stored:
+            # the row first: the GC cannot remove the file of an object whose grace period just restarted
+            await register_media(db, stored)
+    except UploadTooLarge as e:
+        UPLOADS.inc("too_large")
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        UPLOADS.inc("rejected")
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return {"success": True, "message": "OK", "data": {"url": f"/uploads/{name}"}}
+    if stored.existed:
+        UPLOADS.inc("deduplicated")
+    else:
+        UPLOADS.inc("stored")
+        UPLOAD_BYTES.inc(amount=stored.size)
+    return ApiResponse(data=UploadResult(
+        key=stored.key,
+        url=f"/uploads/{stored.key}",
+        mime=stored.content_type,
+        size=stored.size,
+        sha256=stored.sha256,
+        filename=stored.filename,
+        deduplicated=stored.existed,
+    ))
@@ -0,0 +1,12 @@
+from typing import Optional
+from app.schemas.common import BaseSchema
+
+
+class UploadResult(BaseSchema):
+    key: str
+    url: str
+    mime: str
+    size: int
+    sha256: str
+    filename: Optional[str] = None
+    deduplicated: bool = False
@@ -0,0 +1,202 @@
+import hashlib
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, List, NamedTuple, Optional
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+# content type -> extension of the stored key; the client's file name is never used for the path
+IMAGE_TYPES = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+# boundaries and part headers on top of the file itself
+_MULTIPART_OVERHEAD = 64 * 1024
+
+# openapi_extra for routes that parse the multipart body themselves
+UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class StoredUpload(NamedTuple):
+    key: str
+    size: int
+    sha256: str
+    content_type: str
+    filename: Optional[str]
+    existed: bool  # these bytes were already stored under `key`
+
+
+class _TempWriter:
+    """A temp file next to the destination plus a running sha256. Every method does disk I/O: call from a thread."""
+
+    def __init__(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+        self.file = os.fdopen(fd, "wb")
+        self.hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> None:
+        self.hash.update(data)
+        self.file.write(data)
+
+    def commit(self, dest: Path) -> None:
+        if dest.exists():
+            # same name, same bytes
+            self.discard()
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.chmod(self.path, 0o644)
+        os.replace(self.path, dest)  # atomic: the URL serves nothing or the whole file
+
+    def discard(self) -> None:
+        self.file.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _Parts:
+    """python-multipart callbacks; collects the bytes of the one file field between stream chunks."""
+
+    def __init__(self, field: str):
+        self.field = field
+        self._header_name = b""
+        self._header_value = b""
+        self._headers: dict = {}
+        self._in_file = False
+        self.file_seen = False
+        self.file_done = False
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.pending: List[bytes] = []
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        is_file = options.get(b"name") == self.field.encode() and b"filename" in options
+        if is_file and self.file_seen:
+            raise ValueError(f"only one '{self.field}' file per request")
+        self._in_file = is_file
+        if is_file:
+            self.file_seen = True
+            self.filename = options[b"filename"].decode("utf-8", "replace")
+            self.content_type = self._headers.get(b"content-type", b"").decode("latin-1").split(";")[0].strip().lower()
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self.pending.append(data[start:end])
+
+    def on_part_end(self) -> None:
+        if self._in_file:
+            self.file_done = True
+            self._in_file = False
+
+    def callbacks(self) -> dict:
+        return {
+            name: getattr(self, name)
+            for name in (
+                "on_part_begin", "on_header_field", "on_header_value", "on_header_end",
+                "on_headers_finished", "on_part_data", "on_part_end",
+            )
+        }
+
+
+@asynccontextmanager
+async def receive_upload(request: Request, directory: Path, max_bytes: int, field: str = "file") -> AsyncIterator[StoredUpload]:
+    """
+    Stream a multipart upload to `directory` without holding it in memory.
+    Chunks go to a temp file through the thread pool as they arrive, hashed on the way; the size limit and the
+    content type are enforced before the rest of the body is read. The upload is yielded once complete; when the
+    block exits cleanly the file gets its content-addressed name (kept as is if those bytes are already stored),
+    otherwise it is dropped. Raises UploadTooLarge, or ValueError for anything else the client got wrong.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise ValueError("expected a multipart/form-data body")
+    length = request.headers.get("content-length")
+    if length and length.isdigit() and int(length) > max_bytes + _MULTIPART_OVERHEAD:
+        raise UploadTooLarge(f"File too large (> {max_bytes // (1024 * 1024)}MB)")
+
+    parts = _Parts(field)
+    parser = MultipartParser(params[b"boundary"], parts.callbacks())
+    writer: Optional[_TempWriter] = None
+    size = 0
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if parts.file_seen and writer is None:
+                if parts.content_type not in IMAGE_TYPES:
+                    raise ValueError(f"Unsupported file type: {parts.content_type or 'unknown'}")
+                writer = await run_in_threadpool(_TempWriter, directory)
+            if parts.pending:
+                data = b"".join(parts.pending)
+                parts.pending.clear()
+                size += len(data)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"File too large (> {max_bytes // (1024 * 1024)}MB)")
+                await run_in_threadpool(writer.write, data)
+        parser.finalize()
+
+        if writer is None:
+            raise ValueError(f"missing '{field}' file field")
+        if not parts.file_done:
+            raise ValueError("upload ended before the file did")
+        sha256 = writer.hash.hexdigest()
+        key = f"{sha256}{IMAGE_TYPES[parts.content_type]}"
+        yield StoredUpload(
+            key=key,
+            size=size,
+            sha256=sha256,
+            content_type=parts.content_type,
+            filename=parts.filename,
+            existed=(directory / key).exists(),
+        )
+        await run_in_threadpool(writer.commit, directory / key)
+    except Exception:
+        if writer is not None:
+            await run_in_threadpool(writer.discard)
+        raise
+    except BaseException:
+        # cancelled (client went away): no awaiting any more, the cleanup is two syscalls
+        if writer is not None:
+            writer.discard()
+        raise
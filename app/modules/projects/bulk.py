@@ -0,0 +1,168 @@
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple, Union
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.markdown import content_hash, render_markdown
+from app.core.ndjson import batched, validated
+from app.core.response_cache import response_cache, PROJECTS_LIST
+from app.db.versions import bump_versions, PROJECTS
+from app.models.project import Project
+from app.models.project_tag import ProjectTag
+from app.models.project_translation import ProjectTranslation
+from app.models.tag import Tag
+from app.modules.media.repository import media_keys, refresh_media_refs
+from app.modules.projects.cards import refresh_project_cards
+from app.modules.projects.catalog import catalog
+from app.modules.projects.repository import invalidate_project_counts
+from app.modules.projects.schemas import ProjectCreate
+from app.modules.projects.tag_index import tag_index
+from app.schemas.common import BulkLineResult, BulkResult
+
+
+def _check(payload: ProjectCreate) -> Union[str, None]:
+    """The per-record rules of create_project that need no database."""
+    if not payload.slug:
+        return "slug is required"
+    if not payload.translations:
+        return "translations must not be empty"
+    langs = [t.lang for t in payload.translations]
+    if len(set(langs)) != len(langs):
+        return "translations.lang must be unique per project"
+    for i, tr in enumerate(payload.translations):
+        if tr.summary is None or tr.content_markdown is None:
+            return f"translations.{i}: summary and content_markdown are required"
+    return None
+
+
+def _render_batch(batch: List[Tuple[int, ProjectCreate]]) -> Dict[str, List[Dict[str, Any]]]:
+    """slug -> rendered columns of each translation, in payload order. CPU-bound: call from a thread."""
+    rendered: Dict[str, List[Dict[str, Any]]] = {}
+    for _, p in batch:
+        rendered[p.slug] = []
+        for tr in p.translations:
+            r = render_markdown(tr.content_markdown)
+            rendered[p.slug].append({
+                "content_html": r.html,
+                "content_toc": r.toc,
+                "reading_minutes": r.reading_minutes,
+                "content_hash": content_hash(tr.content_markdown),
+            })
+    return rendered
+
+
+async def _insert_batch(db: AsyncSession, batch: List[Tuple[int, ProjectCreate]], result: BulkResult) -> bool:
+    """True when the batch was committed."""
+    # the whole batch in one thread pool call, before the transaction starts: the event loop keeps serving
+    rendered = await run_in_threadpool(_render_batch, batch)
+
+    slugs = [p.slug for _, p in batch]
+    existing = set((await db.execute(select(Project.slug).where(Project.slug.in_(slugs)))).scalars().all())
+    wanted_tags = {int(t) for _, p in batch for t in p.tag_ids}
+    known_tags: Set[int] = set()
+    if wanted_tags:
+        known_tags = set((await db.execute(select(Tag.id).where(Tag.id.in_(wanted_tags)))).scalars().all())
+
+    rows: List[Tuple[int, ProjectCreate]] = []
+    for line_no, p in batch:
+        if p.slug in existing:
+            result.results.append(BulkLineResult(line=line_no, ok=False, slug=p.slug, error="slug already exists"))
+        elif not {int(t) for t in p.tag_ids} <= known_tags:
+            result.results.append(BulkLineResult(line=line_no, ok=False, slug=p.slug, error="Some tag_ids do not exist"))
+        else:
+            rows.append((line_no, p))
+    if not rows:
+        await db.rollback()  # ends the read-only transaction before the next batch renders
+        return False
+
+    now = datetime.now(timezone.utc)
+    try:
+        # one multi-row INSERT per table for the whole batch
+        inserted = (
+            await db.execute(
+                insert(Project).returning(Project.id, Project.slug),
+                [
+                    {
+                        "slug": p.slug,
+                        "cover_image_url": p.cover_image_url,
+                        "repo_url": p.repo_url,
+                        "demo_url": p.demo_url,
+                        "status": p.status or "draft",
+                        "published_at": p.published_at or (now if p.status == "published" else None),
+                    }
+                    for _, p in rows
+                ],
+            )
+        ).all()
+        ids: Dict[str, int] = {r.slug: r.id for r in inserted}
+
+        translations: List[Dict[str, Any]] = []
+        for _, p in rows:
+            for tr, columns in zip(p.translations, rendered[p.slug]):
+                translations.append({
+                    "project_id": ids[p.slug],
+                    "lang": tr.lang,
+                    "title": tr.title,
+                    "summary": tr.summary,
+                    "content_markdown": tr.content_markdown,
+                    **columns,
+                })
+        await db.execute(insert(ProjectTranslation), translations)
+
+        links = [{"project_id": ids[p.slug], "tag_id": tid} for _, p in rows for tid in {int(t) for t in p.tag_ids}]
+        if links:
+            await db.execute(insert(ProjectTag), links)
+
+        await refresh_project_cards(db, ids.values())
+        await refresh_media_refs(
+            db, media_keys(*(p.cover_image_url for _, p in rows), *(tr.content_markdown for _, p in rows for tr in p.translations))
+        )
+        await bump_versions(db, PROJECTS)
+        await db.commit()
+    except IntegrityError as e:
+        # e.g. a slug taken concurrently; earlier batches stay committed
+        await db.rollback()
+        error = f"batch rejected: {e.orig}"
+        result.results.extend(BulkLineResult(line=line_no, ok=False, slug=p.slug, error=error) for line_no, p in rows)
+        return False
+
+    result.results.extend(BulkLineResult(line=line_no, ok=True, id=ids[p.slug], slug=p.slug) for line_no, p in rows)
+    return True
+
+
+async def bulk_create_projects(db: AsyncSession, lines: AsyncIterator[Tuple[int, Any]], batch_size: int = 500) -> BulkResult:
+    """
+    Create projects from NDJSON lines (one ProjectCreate per line).
+    Lines are validated as they stream in; every batch of valid records is written and committed on its own,
+    so a bad line or a rejected batch never undoes earlier batches.
+    """
+    result = BulkResult()
+    seen: Set[str] = set()
+
+    async def valid_records():
+        async for line_no, record in validated(lines, ProjectCreate):
+            error = record if isinstance(record, str) else _check(record)
+            if error is None and record.slug in seen:
+                error = "duplicate slug in this import"
+            if error is not None:
+                result.results.append(BulkLineResult(line=line_no, ok=False, slug=getattr(record, "slug", None), error=error))
+                continue
+            seen.add(record.slug)
+            yield line_no, record
+
+    committed = 0
+    async for batch in batched(valid_records(), batch_size):
+        committed += await _insert_batch(db, batch, result)
+
+    result.results.sort(key=lambda r: r.line)
+    result.created = sum(1 for r in result.results if r.ok)
+    result.failed = len(result.results) - result.created
+    if result.created:
+        invalidate_project_counts()
+        response_cache.evict(PROJECTS_LIST)
+        tag_index.invalidate()
+        await catalog.refresh((r.id for r in result.results if r.ok), {PROJECTS: committed})
+    return result
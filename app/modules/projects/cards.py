@@ -0,0 +1,92 @@
+from typing import Iterable, List
+
+from sqlalchemy import delete, func, insert, literal_column, select, update
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.project_card import ProjectCard
+from app.models.project_tag import ProjectTag
+from app.models.project_translation import ProjectTranslation
+from app.models.tag import Tag
+from app.models.tag_translation import TagTranslation
+
+
+def tags_json(project_id, lang):
+    """Correlated subquery: tags of one project as a JSON array of TagSimple dicts."""
+    tag_obj = func.jsonb_build_object(
+        "id", Tag.id,
+        "slug", Tag.slug,
+        "name", func.coalesce(TagTranslation.name, Tag.slug),
+    )
+    return (
+        select(func.coalesce(func.jsonb_agg(aggregate_order_by(tag_obj, Tag.id)), literal_column("'[]'::jsonb"), type_=JSONB))
+        .select_from(ProjectTag)
+        .join(Tag, Tag.id == ProjectTag.tag_id)
+        .outerjoin(TagTranslation, (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang))
+        .where(ProjectTag.project_id == project_id)
+        .scalar_subquery()
+    )
+
+
+def _tag_ids_array(project_id):
+    return (
+        select(func.coalesce(func.array_agg(aggregate_order_by(ProjectTag.tag_id, ProjectTag.tag_id)), literal_column("'{}'::integer[]")))
+        .where(ProjectTag.project_id == project_id)
+        .scalar_subquery()
+    )
+
+
+_CARD_COLUMNS = (
+    "project_id", "lang", "slug", "cover_image_url", "repo_url", "demo_url", "status", "published_at",
+    "title", "summary", "content_markdown", "content_html", "content_toc", "reading_minutes",
+    "tags", "tag_ids", "search_vector",
+)
+
+
+def _card_source():
+    return (
+        select(
+            Project.id,
+            ProjectTranslation.lang,
+            Project.slug,
+            Project.cover_image_url,
+            Project.repo_url,
+            Project.demo_url,
+            Project.status,
+            Project.published_at,
+            ProjectTranslation.title,
+            ProjectTranslation.summary,
+            ProjectTranslation.content_markdown,
+            ProjectTranslation.content_html,
+            ProjectTranslation.content_toc,
+            ProjectTranslation.reading_minutes,
+            tags_json(Project.id, ProjectTranslation.lang),
+            _tag_ids_array(Project.id),
+            ProjectTranslation.search_vector,
+        )
+        .join(ProjectTranslation, ProjectTranslation.project_id == Project.id)
+    )
+
+
+async def touch_projects(db: AsyncSession, project_ids: Iterable[int]) -> None:
+    """Set projects.updated_at for changes made outside the projects row (translations, tags); the export filters on it."""
+    ids = sorted(set(project_ids))
+    if ids:
+        await db.execute(update(Project).where(Project.id.in_(ids)).values(updated_at=func.now()))
+
+
+async def refresh_project_cards(db: AsyncSession, project_ids: Iterable[int]) -> None:
+    """Rebuild the cards of `project_ids` from the source tables; call inside the writing transaction."""
+    ids: List[int] = sorted(set(project_ids))
+    if not ids:
+        return
+    await db.flush()
+    await db.execute(delete(ProjectCard).where(ProjectCard.project_id.in_(ids)))
+    await db.execute(
+        insert(ProjectCard).from_select(_CARD_COLUMNS, _card_source().where(Project.id.in_(ids)))
+    )
+
+
+async def project_ids_for_tag(db: AsyncSession, tag_id: int) -> List[int]:
+    return list((await db.execute(select(ProjectTag.project_id).where(ProjectTag.tag_id == tag_id))).scalars().all())
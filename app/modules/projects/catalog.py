@@ -0,0 +1,293 @@
+import asyncio
+import logging
+import math
+from contextlib import suppress
+from bisect import bisect_left, bisect_right
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.session import async_session_factory
+from app.db.versions import Version, read_versions
+from app.models.project_card import ProjectCard
+from app.modules.projects.projection import DETAIL, LIST_ITEM
+from app.modules.projects.schemas import ProjectDetail, ProjectListItem, TagMode
+from app.modules.projects.tag_index import SortKey, sort_key
+from app.schemas.common import Page, PaginationMeta
+
+logger = logging.getLogger(__name__)
+
+
+class _LangView:
+    __slots__ = ("items", "keys", "positions", "tag_members")
+
+    def __init__(self, items: Tuple[ProjectListItem, ...], keys: Tuple[SortKey, ...], tag_members: Dict[int, FrozenSet[int]]):
+        self.items = items  # display order: published_at DESC NULLS LAST, id DESC
+        self.keys = keys
+        self.positions: Dict[int, int] = {item.id: pos for pos, item in enumerate(items)}
+        self.tag_members = tag_members  # tag id -> ids of the projects carrying it
+
+    @classmethod
+    def build(cls, items: List[ProjectListItem]) -> "_LangView":
+        items = sorted(items, key=lambda i: sort_key(i.published_at, i.id))
+        members: Dict[int, set] = {}
+        for item in items:
+            for tag in item.tags:
+                members.setdefault(tag.id, set()).add(item.id)
+        keys = tuple(sort_key(i.published_at, i.id) for i in items)
+        return cls(tuple(items), keys, {tid: frozenset(m) for tid, m in members.items()})
+
+    def replace(self, ids: FrozenSet[int], new_items: List[ProjectListItem]) -> Tuple[List[ProjectListItem], "_LangView"]:
+        """(the items dropped, a view with the projects in `ids` replaced by `new_items`); sorting keys are reused."""
+        removed = [item for item in self.items if item.id in ids]
+        if removed:
+            keep = [pos for pos, item in enumerate(self.items) if item.id not in ids]
+            items = [self.items[pos] for pos in keep]
+            keys = [self.keys[pos] for pos in keep]
+        else:
+            items, keys = list(self.items), list(self.keys)
+        for item in new_items:
+            key = sort_key(item.published_at, item.id)
+            at = bisect_left(keys, key)
+            keys.insert(at, key)
+            items.insert(at, item)
+
+        members = dict(self.tag_members)
+        for tid in {tag.id for item in removed + new_items for tag in item.tags}:
+            carriers = (members.get(tid, frozenset()) - ids) | {i.id for i in new_items if any(t.id == tid for t in i.tags)}
+            if carriers:
+                members[tid] = frozenset(carriers)
+            else:
+                members.pop(tid, None)
+        return removed, _LangView(tuple(items), tuple(keys), members)
+
+
+class CatalogSnapshot:
+    """
+    Everything the public project reads need, for published projects only.
+    Never mutated after construction; a new snapshot replaces the old one as a whole.
+    """
+
+    def __init__(self, versions: Dict[str, Version], rows: Sequence) -> None:
+        """`rows`: DETAIL projection rows plus a lang column."""
+        self.versions = versions
+        self._details: Dict[Tuple[str, str], ProjectDetail] = {}
+        by_lang: Dict[str, List[ProjectListItem]] = {}
+        for row in rows:
+            by_lang.setdefault(row.lang, []).append(LIST_ITEM.build(row))
+            self._details[(row.slug, row.lang)] = DETAIL.build(row)
+        self._langs: Dict[str, _LangView] = {lang: _LangView.build(items) for lang, items in by_lang.items()}
+
+    def replace_projects(self, versions: Dict[str, Version], project_ids: Iterable[int], rows: Sequence) -> "CatalogSnapshot":
+        """
+        A new snapshot at `versions`, with the projects in `project_ids` taken from `rows` (their published cards
+        now; an id without rows is no longer public). Only those rows are built; everything else is reused.
+        """
+        ids = frozenset(project_ids)
+        new_items: Dict[str, List[ProjectListItem]] = {}
+        for row in rows:
+            new_items.setdefault(row.lang, []).append(LIST_ITEM.build(row))
+
+        patched = CatalogSnapshot.__new__(CatalogSnapshot)
+        patched.versions = versions
+        patched._details = dict(self._details)
+        patched._langs = {}
+        for lang in set(self._langs) | set(new_items):
+            view = self._langs.get(lang) or _LangView.build([])
+            removed, patched._langs[lang] = view.replace(ids, new_items.get(lang, []))
+            for item in removed:
+                patched._details.pop((item.slug, lang), None)
+        for row in rows:
+            patched._details[(row.slug, row.lang)] = DETAIL.build(row)
+        return patched
+
+    def __len__(self) -> int:
+        return len(self._details)
+
+    def detail(self, slug: str, lang: str) -> Optional[ProjectDetail]:
+        return self._details.get((slug, lang))
+
+    def langs(self) -> List[str]:
+        return sorted(self._langs)
+
+    def items(self, lang: str) -> Tuple[ProjectListItem, ...]:
+        view = self._langs.get(lang)
+        return view.items if view is not None else ()
+
+    def list_projects(
+        self,
+        lang: str,
+        page: int = 1,
+        page_size: int = 10,
+        tag_ids: Optional[List[int]] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        tag_mode: TagMode = "any",
+    ) -> Page[ProjectListItem]:
+        """Same contract as list_projects_paginated_v3 for status=published, no q, recent order."""
+        page = max(int(page or 1), 1)
+        page_size = max(1, min(int(page_size or 10), 100))
+        seek = decode_cursor(cursor) if cursor else None
+
+        view = self._langs.get(lang)
+        if view is None:
+            positions: List[int] = []
+        elif tag_ids:
+            sets = [view.tag_members.get(tid, frozenset()) for tid in tag_ids]
+            matched = frozenset.intersection(*sets) if tag_mode == "all" else frozenset().union(*sets)
+            positions = sorted(view.positions[pid] for pid in matched)
+        else:
+            positions = list(range(len(view.items)))
+
+        if seek:
+            seek_published_at, seek_id, direction = seek
+            keys = [view.keys[p] for p in positions]
+            key = sort_key(seek_published_at, seek_id)
+            if direction == "next":
+                start = bisect_right(keys, key)
+                end = start + page_size
+                has_next, has_prev = end < len(positions), True
+            else:
+                end = bisect_left(keys, key)
+                start = max(0, end - page_size)
+                has_next, has_prev = True, start > 0
+        else:
+            start = (page - 1) * page_size
+            end = start + page_size
+            has_next, has_prev = end < len(positions), page > 1
+
+        items = [view.items[p] for p in positions[start:end]] if view is not None else []
+        total_items = len(positions) if include_total else None
+        total_pages = None
+        if total_items is not None:
+            total_pages = 0 if total_items == 0 else math.ceil(total_items / page_size)
+
+        return Page(
+            items=items,
+            meta=PaginationMeta(
+                page=None if seek else page,
+                page_size=page_size,
+                total_items=total_items,
+                total_pages=total_pages,
+                has_next=has_next,
+                next_cursor=encode_cursor(items[-1].published_at, items[-1].id, "next") if items and has_next else None,
+                prev_cursor=encode_cursor(items[0].published_at, items[0].id, "prev") if items and has_prev else None,
+            ),
+        )
+
+
+# a write touching more projects than this is left to a full reload in the background
+PATCH_MAX_PROJECTS = 1000
+
+
+async def load_snapshot() -> CatalogSnapshot:
+    async with async_session_factory() as db:
+        # versions and cards from one snapshot, so ETags always match the content served
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        versions = await read_versions(db)
+        stmt = select(*DETAIL.columns, ProjectCard.lang).where(ProjectCard.status == "published")
+        rows = (await db.execute(stmt)).all()
+    return CatalogSnapshot(versions, rows)
+
+
+async def patch_snapshot(snapshot: CatalogSnapshot, project_ids: Sequence[int], bumps: Dict[str, int]) -> Optional[CatalogSnapshot]:
+    """
+    `snapshot` plus one committed write that touched `project_ids` and bumped the versions by `bumps`.
+    None when content_versions shows other writes since the snapshot too: only a full load has those.
+    """
+    async with async_session_factory() as db:
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        versions = await read_versions(db)
+        expected = {scope: v.version + bumps.get(scope, 0) for scope, v in snapshot.versions.items()}
+        if {scope: v.version for scope, v in versions.items()} != expected:
+            return None
+        rows: Sequence = []
+        if project_ids:
+            stmt = select(*DETAIL.columns, ProjectCard.lang).where(
+                ProjectCard.status == "published", ProjectCard.project_id.in_(project_ids)
+            )
+            rows = (await db.execute(stmt)).all()
+    return snapshot.replace_projects(versions, project_ids, rows)
+
+
+class CatalogEngine:
+    """
+    Holds the current CatalogSnapshot. Local writes patch in the projects they touched; anything else that moves
+    content_versions (other workers, large imports) is picked up by a full reload in the background.
+    """
+
+    def __init__(self, enabled: bool, poll_interval: float):
+        self.enabled = enabled
+        self.poll_interval = poll_interval
+        self.snapshot: Optional[CatalogSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        return self.snapshot if self.enabled else None
+
+    async def reload(self) -> None:
+        if not self.enabled:
+            return
+        async with self._lock:
+            self.snapshot = await load_snapshot()
+
+    async def refresh(self, project_ids: Iterable[int] = (), bumps: Optional[Dict[str, int]] = None) -> None:
+        """
+        After a local write has committed: patch the projects it touched (`project_ids`; for a tag write, the
+        projects carrying the tag) into the snapshot, so this worker serves the change right away. `bumps`: how far
+        the write moved each content_versions scope. Falls back to waking the poller for a full reload.
+        """
+        if self._task is None:
+            return
+        ids = sorted(set(project_ids))
+        snapshot = self.snapshot
+        # a reload in progress may predate this write: let the poller run another one after it
+        if snapshot is not None and len(ids) <= PATCH_MAX_PROJECTS and not self._lock.locked():
+            try:
+                async with self._lock:
+                    if self.snapshot is snapshot:
+                        patched = await patch_snapshot(snapshot, ids, bumps or {})
+                        if patched is not None:
+                            self.snapshot = patched
+                            return
+            except Exception:
+                logger.exception("catalog patch after write failed; reloading in the background")
+        self._wake.set()
+
+    async def _poll(self) -> None:
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            self._wake.clear()
+            try:
+                async with async_session_factory() as db:
+                    versions = await read_versions(db)
+                if self.snapshot is None or versions != self.snapshot.versions:
+                    await self.reload()
+            except Exception:
+                logger.exception("catalog refresh failed; keeping the previous snapshot")
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            await self.reload()
+        except Exception:
+            # reads fall back to the database until the poller manages a load
+            logger.exception("catalog load failed")
+        self._task = asyncio.create_task(self._poll())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            # let a poll caught mid-query release its connection before the loop goes away
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+catalog = CatalogEngine(enabled=settings.CATALOG_ENABLED, poll_interval=settings.CATALOG_POLL_SECONDS)
@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import JSON, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app.db.session import async_session_factory
+from app.models.project import Project
+from app.models.project_tag import ProjectTag
+from app.models.project_translation import ProjectTranslation
+from app.models.tag import Tag
+from app.models.tag_translation import TagTranslation
+from app.modules.projects.schemas import ProjectExport
+from app.schemas.common import Lang
+
+EXPORT_BATCH_SIZE = 500
+
+_EMPTY = literal_column("'[]'::json")
+
+
+def _translations_json(lang: Optional[Lang]):
+    obj = func.json_build_object(
+        "id", ProjectTranslation.id,
+        "lang", ProjectTranslation.lang,
+        "title", ProjectTranslation.title,
+        "summary", ProjectTranslation.summary,
+        "content_markdown", ProjectTranslation.content_markdown,
+    )
+    stmt = select(func.coalesce(func.json_agg(aggregate_order_by(obj, ProjectTranslation.lang)), _EMPTY, type_=JSON)).where(
+        ProjectTranslation.project_id == Project.id
+    )
+    if lang is not None:
+        stmt = stmt.where(ProjectTranslation.lang == lang)
+    return stmt.scalar_subquery()
+
+
+def _tags_json():
+    names = (
+        select(func.coalesce(
+            func.json_agg(aggregate_order_by(func.json_build_object("lang", TagTranslation.lang, "name", TagTranslation.name), TagTranslation.lang)),
+            _EMPTY,
+        ))
+        .where(TagTranslation.tag_id == Tag.id)
+        .scalar_subquery()
+    )
+    obj = func.json_build_object("id", Tag.id, "slug", Tag.slug, "translations", names)
+    return (
+        select(func.coalesce(func.json_agg(aggregate_order_by(obj, Tag.id)), _EMPTY, type_=JSON))
+        .select_from(ProjectTag)
+        .join(Tag, Tag.id == ProjectTag.tag_id)
+        .where(ProjectTag.project_id == Project.id)
+        .scalar_subquery()
+    )
+
+
+async def stream_project_export(
+    status: Optional[str] = None,
+    lang: Optional[Lang] = None,
+    updated_since: Optional[datetime] = None,
+) -> AsyncIterator[bytes]:
+    """
+    NDJSON, one fully assembled ProjectExport per line, ordered by id.
+    Rows come from a server-side cursor in batches of EXPORT_BATCH_SIZE, so memory does not grow with the catalog.
+    Uses its own session: the response body is produced after the request's dependencies are gone.
+    updated_since compares with projects.updated_at, which project, translation, tag-assignment and tag edits all set.
+    """
+    stmt = select(
+        Project.id,
+        Project.slug,
+        Project.cover_image_url,
+        Project.repo_url,
+        Project.demo_url,
+        Project.status,
+        Project.published_at,
+        Project.created_at,
+        Project.updated_at,
+        _translations_json(lang).label("translations"),
+        _tags_json().label("tags"),
+    ).order_by(Project.id)
+    if status is not None:
+        stmt = stmt.where(Project.status == status)
+    if lang is not None:
+        stmt = stmt.where(
+            select(ProjectTranslation.id)
+            .where(ProjectTranslation.project_id == Project.id, ProjectTranslation.lang == lang)
+            .exists()
+        )
+    if updated_since is not None:
+        stmt = stmt.where(Project.updated_at >= updated_since)
+
+    async with async_session_factory() as db:
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            chunk = bytearray()
+            for row in rows:
+                data = dict(row._mapping)
+                data["tag_ids"] = [t["id"] for t in data["tags"]]
+                chunk += ProjectExport.model_validate(data).model_dump_json().encode()
+                chunk += b"\n"
+            yield bytes(chunk)
@@ -0,0 +1,85 @@
+from typing import Any, Callable, Iterable, List, NamedTuple, Tuple
+
+from sqlalchemy import Select, select
+
+from app.models.project_card import ProjectCard
+from app.modules.projects.schemas import ProjectDetail, ProjectListItem, TocEntry
+from app.modules.tags.schemas import TagSimple
+from app.schemas.common import Lang
+
+
+class Projection(NamedTuple):
+    """The project_cards columns one DTO needs, and how to build the DTO from a row of them."""
+    columns: Tuple[Any, ...]
+    build: Callable[[Any], Any]
+
+    def select(self, lang: Lang, *extra: Any) -> Select:
+        return select(*self.columns, *extra).where(ProjectCard.lang == lang)
+
+    def all(self, rows: Iterable[Any]) -> List[Any]:
+        return [self.build(row) for row in rows]
+
+
+def tag_items(tags) -> List[TagSimple]:
+    return [TagSimple.model_construct(**t) for t in tags]
+
+
+# rows come straight from project_cards, so the models are built without re-validation
+def _list_item(row) -> ProjectListItem:
+    return ProjectListItem.model_construct(
+        id=row.id,
+        slug=row.slug,
+        cover_image_url=row.cover_image_url,
+        repo_url=row.repo_url,
+        demo_url=row.demo_url,
+        status=row.status,
+        published_at=row.published_at,
+        title=row.title,
+        summary=row.summary,
+        tags=tag_items(row.tags),
+    )
+
+
+def _detail(row) -> ProjectDetail:
+    return ProjectDetail.model_construct(
+        id=row.id,
+        slug=row.slug,
+        cover_image_url=row.cover_image_url,
+        repo_url=row.repo_url,
+        demo_url=row.demo_url,
+        status=row.status,
+        published_at=row.published_at,
+        title=row.title,
+        summary=row.summary,
+        content_markdown=row.content_markdown,
+        content_html=row.content_html,
+        toc=[TocEntry.model_construct(**e) for e in row.content_toc or []],
+        reading_minutes=row.reading_minutes,
+        tags=tag_items(row.tags),
+    )
+
+
+_LIST_COLUMNS = (
+    ProjectCard.project_id.label("id"),
+    ProjectCard.slug,
+    ProjectCard.cover_image_url,
+    ProjectCard.repo_url,
+    ProjectCard.demo_url,
+    ProjectCard.status,
+    ProjectCard.published_at,
+    ProjectCard.title,
+    ProjectCard.summary,
+    ProjectCard.tags,
+)
+
+# list views never read the content columns
+LIST_ITEM = Projection(_LIST_COLUMNS, _list_item)
+DETAIL = Projection(
+    _LIST_COLUMNS + (
+        ProjectCard.content_markdown,
+        ProjectCard.content_html,
+        ProjectCard.content_toc,
+        ProjectCard.reading_minutes,
+    ),
+    _detail,
+)
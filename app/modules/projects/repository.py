@@ -1,108 +1,65 @@
 import math
 from datetime import datetime, timezone
 from typing import List, Tuple, Dict, Optional
-from sqlalchemy import select, func, or_, delete
+from sqlalchemy import select, func, or_, and_, delete, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.markdown import content_hash, render_markdown
+from app.core.metrics import registry
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.response_cache import response_cache, PROJECTS_LIST, project_dep
+from app.db.versions import bump_versions, reads_are_current, PROJECTS
 from app.schemas.common import Lang, PaginationMeta, Page
 
-from app.modules.projects.schemas import ProjectListItem, ProjectDetail, ProjectCreate, ProjectRead, ProjectTranslationRead, ProjectUpdate, ProjectTranslationIn
+from app.modules.media.repository import media_keys, refresh_media_refs
+from app.modules.projects.cards import refresh_project_cards
+from app.modules.projects.catalog import catalog
+from app.modules.projects.projection import DETAIL, LIST_ITEM
+from app.modules.projects.tag_index import tag_index
+from app.modules.projects.schemas import ProjectSort, TagMode, ProjectListItem, ProjectDetail, ProjectCreate, ProjectRead, ProjectTranslationRead, ProjectUpdate, ProjectTranslationIn
 from app.modules.tags.schemas import TagSimple
 from app.models.project import Project
-from app.models.project_translation import ProjectTranslation
+from app.models.project_card import ProjectCard
+from app.models.project_translation import ProjectTranslation, SEARCH_CONFIGS
 from app.models.tag import Tag
 from app.models.project_tag import ProjectTag
-from app.models.tag_translation import TagTranslation
 
-async def list_projects(db: AsyncSession, lang: Lang, status: str | None = "published") -> List[ProjectListItem]:
-    stmt = (
-        select(Project, ProjectTranslation, Tag, TagTranslation)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-        .outerjoin(Project.tags)
-        .outerjoin(TagTranslation, (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang))
-        .order_by(Project.published_at.desc())
-    )
+_project_counts = TTLCache(maxsize=64, ttl=settings.COUNT_CACHE_TTL_SECONDS)
+registry.register_cache("project_counts", _project_counts)
 
-    if status is not None:
-        stmt = stmt.where(Project.status == status)
-
-    result = await db.execute(stmt)
-    rows = result.unique().all()
-    items_by_id: dict[int, ProjectListItem] = {}
-    seen_tags: dict[int, set[int]] = {}
-
-    for project, project_tr, tag, tag_tr in rows:
-        pid = project.id
-
-        if pid not in items_by_id:
-            items_by_id[pid] = ProjectListItem(
-                id=project.id,
-                slug=project.slug,
-                cover_image_url=getattr(project, "cover_image_url", None),
-                repo_url=getattr(project, "repo_url", None),
-                demo_url=getattr(project, "demo_url", None),
-                status=getattr(project, "status", None),
-                published_at=getattr(project, "published_at", None),
-                title=project_tr.title,
-                summary=project_tr.summary,
-                tags=[],
-            )
-            seen_tags[pid] = set()
-        
-        if tag is not None and tag.id not in seen_tags[pid]:
-            tag_name = None
-            if tag_tr is not None:
-                tag_name = getattr(tag_tr, "name", None)
-            
-            items_by_id[pid].tags.append(
-                TagSimple(
-                    id=tag.id,
-                    slug=tag.slug,
-                    name=tag_name or tag.slug,
-                )
-            )
-            seen_tags[pid].add(tag.id)
+def invalidate_project_counts() -> None:
+    _project_counts.clear()
 
-    return list(items_by_id.values())
+async def list_projects(db: AsyncSession, lang: Lang, status: str | None = "published") -> List[ProjectListItem]:
+    stmt = LIST_ITEM.select(lang).order_by(ProjectCard.published_at.desc(), ProjectCard.project_id.desc())
+    if status is not None:
+        stmt = stmt.where(ProjectCard.status == status)
+    return LIST_ITEM.all((await db.execute(stmt)).all())
 
 async def get_project_by_slug(db: AsyncSession, slug: str, lang: Lang, status: str | None = "published") -> ProjectDetail | None:
-    stmt = (
-        select(Project, ProjectTranslation, Tag, TagTranslation)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-        .outerjoin(Project.tags)
-        .outerjoin(TagTranslation, (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang))
-        .where(Project.slug == slug)
-    )
-
+    stmt = DETAIL.select(lang).where(ProjectCard.slug == slug)
     if status is not None:
-        stmt = stmt.where(Project.status == status)
-    
-    result = await db.execute(stmt)
-    rows = result.unique().all()
-    if not rows:
-        return None
-    project, project_tr, _, _ = rows[0]
+        stmt = stmt.where(ProjectCard.status == status)
 
-    tags: List[TagSimple] = []
-    seen = set()
-    for _, _, tag, tag_tr in rows:
-        if tag and tag.id not in seen:
-            tags.append(TagSimple(id=tag.id, slug=tag.slug, name=(tag_tr.name if tag_tr else None) or tag.slug))
-            seen.add(tag.id)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+    return DETAIL.build(row)
 
-    return ProjectDetail(
-        id=project.id,
-        slug=project.slug,
-        cover_image_url=getattr(project, "cover_image_url", None),
-        repo_url=getattr(project, "repo_url", None),
-        demo_url=getattr(project, "demo_url", None),
-        status=getattr(project, "status", None),
-        published_at=getattr(project, "published_at", None),
-        title=project_tr.title,
-        summary=project_tr.summary,
-        content_markdown=project_tr.content_markdown,
-        tags=tags,
+async def _list_page(db: AsyncSession, lang: Lang, status: Optional[str], offset: int, limit: int) -> Tuple[List[ProjectListItem], int]:
+    filters = _project_filters(status, None, [])
+    total_items = await _count_projects(db, lang, filters)
+    stmt = (
+        LIST_ITEM.select(lang)
+        .where(*filters)
+        .order_by(*_page_order(ProjectCard.published_at, ProjectCard.project_id))
+        .limit(limit)
+        .offset(offset)
     )
+    return LIST_ITEM.all((await db.execute(stmt)).all()), total_items
 
 async def list_projects_paginated(
         db: AsyncSession,
@@ -115,62 +72,16 @@ async def list_projects_paginated(
     page_size = min(max(page_size, 1), 100)
     offset = (page - 1) * page_size
 
-    count_stmt = (
-        select(func.count(func.distinct(Project.id)))
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang ))
-    )
-    if status is not None:
-        count_stmt = count_stmt.where(Project.status == status)
-    
-    total_items = (await db.execute(count_stmt)).scalar_one()
+    items, total_items = await _list_page(db, lang, status, offset, page_size)
     total_pages = max(1, math.ceil(total_items / page_size)) if total_items else 1
 
-    stmt = (
-        select(Project, ProjectTranslation, Tag, TagTranslation)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-        .outerjoin(Project.tags)
-        .outerjoin(TagTranslation, (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang))
-        .order_by(Project.published_at.desc().nullslast(), Project.id.desc())
-        .limit(page_size)
-        .offset(offset)
-    )
-    if status is not None:
-        stmt = stmt.where(Project.status == status)
-
-    rows = (await db.execute(stmt)).unique().all()
-
-    items_by_id: dict[int, ProjectListItem] = {}
-    seen_tags: dict[int, set[int]] = {}
-
-    for project, project_tr, tag, tag_tr in rows:
-        pid = project.id
-        if pid not in items_by_id:
-            items_by_id[pid] = ProjectListItem(
-                id=project.id,
-                slug=project.slug,
-                cover_image_url=getattr(project, "cover_image_url", None),
-                repo_url=getattr(project, "repo_url", None),
-                demo_url=getattr(project, "demo_url", None),
-                status=getattr(project, "status", None),
-                published_at=getattr(project, "published_at", None),
-                title=project_tr.title,
-                summary=project_tr.summary,
-                tags=[],
-            )
-            seen_tags[pid] = set()
-
-        if tag is not None and tag.id not in seen_tags[pid]:
-            tag_name = (getattr(tag_tr, "name", None) if tag_tr is not None else None) or tag.slug
-            items_by_id[pid].tags.append(TagSimple(id=tag.id, slug=tag.slug, name=tag_name))
-            seen_tags[pid].add(tag.id)
-
     meta = PaginationMeta(
         page=page,
         page_size=page_size,
         total_items=total_items,
         total_pages=total_pages
     )
-    return list(items_by_id.values()), meta
+    return items, meta
 
 async def list_projects_paginated_v2(
         db: AsyncSession,
@@ -184,88 +95,9 @@ async def list_projects_paginated_v2(
     page_size = max(1, min(page_size, 100))
     offset = (page -1)*page_size
 
-    count_stmt = (
-        select(func.count(func.distinct(Project.id)))
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-    )
-    if status is not None:
-        count_stmt = count_stmt.where(Project.status == status)
-
-    total_items = (await db.execute(count_stmt)).scalar_one()
+    items, total_items = await _list_page(db, lang, status, offset, page_size)
     total_pages = 0 if total_items == 0 else math.ceil(total_items / page_size)
 
-    ids_stmt = (
-        select(Project.id)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-    )
-    if status is not None:
-        ids_stmt = ids_stmt.where(Project.status == status)
-
-    ids_stmt = (
-        ids_stmt
-        .group_by(Project.id, Project.published_at)
-        .order_by(Project.published_at.desc().nullslast(), Project.id.desc())
-        .limit(page_size)
-        .offset(offset)
-    )
-
-    ids = [r[0] for r in (await db.execute(ids_stmt)).all()]
-
-    if not ids:
-        return Page(
-            items=[],
-            meta={
-                "page": page,
-                "page_size": page_size,
-                "total_items": total_items,
-                "total_pages": total_pages
-            }
-        )
-    
-    data_stmt = (
-        select(Project, ProjectTranslation, Tag, TagTranslation)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-        .outerjoin(Project.tags)
-        .outerjoin(TagTranslation, (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang))
-        .where(Project.id.in_(ids))
-    )
-
-    rows = (await db.execute(data_stmt)).unique().all()
-
-    items_by_id: dict[int, ProjectListItem] = {}
-    seen_tags: dict[int, set[int]] = {}
-
-    for project, project_tr, tag, tag_tr in rows:
-        pid = project.id
-        if pid not in items_by_id:
-            items_by_id[pid] = ProjectListItem(
-                id=project.id,
-                slug=project.slug,
-                cover_image_url=getattr(project, "cover_image_url", None),
-                repo_url=getattr(project, "repo_url", None),
-                demo_url=getattr(project, "demo_url", None),
-                status=project.status,
-                published_at=project.published_at,
-                title=project_tr.title,
-                summary=getattr(project_tr, "summary", None),
-                tags=[]
-            )
-            seen_tags[pid] = set()
-
-        if tag is not None:
-            if tag.id not in seen_tags[pid]:
-                items_by_id[pid].tags.append(
-                    TagSimple(
-                        id=tag.id,
-                        slug=tag.slug,
-                        name=((tag_tr.name if tag_tr else None) or tag.slug)
-                    )
-                )
-                seen_tags[pid].add(tag.id)
-    items = list(items_by_id.values())
-    order = {id_: i for i, id_ in enumerate(ids)}
-    items.sort(key=lambda x: order.get(x.id, 10**9))
-
     meta = PaginationMeta(
         page=page,
         page_size=page_size,
@@ -321,13 +153,22 @@ async def create_project(db: AsyncSession, payload: ProjectCreate) -> ProjectRea
                 content_markdown=tr.content_markdown
             )
         )
+    for tr_model in tr_models:
+        _render_translation(tr_model)
     db.add_all(tr_models)
     await db.flush()
 
     for tid in tag_ids:
         db.add(ProjectTag(project_id=project.id, tag_id=tid))
 
+    await refresh_project_cards(db, [project.id])
+    await refresh_media_refs(db, media_keys(payload.cover_image_url, *(tr.content_markdown for tr in payload.translations)))
+    await bump_versions(db, PROJECTS)
     await db.commit()
+    invalidate_project_counts()
+    response_cache.evict(PROJECTS_LIST, project_dep(project.slug))
+    await tag_index.refresh_project(db, project.id)
+    await catalog.refresh([project.id], {PROJECTS: 1})
     await db.refresh(project)
 
     tags: List[TagSimple] = []
@@ -362,6 +203,64 @@ async def create_project(db: AsyncSession, payload: ProjectCreate) -> ProjectRea
         tags=tags
     )
 
+def _search_query(lang: Lang, q: str):
+    config = literal(SEARCH_CONFIGS.get(lang, "simple"), type_=REGCONFIG)
+    return func.websearch_to_tsquery(config, q)
+
+def _project_filters(status: Optional[str], ts_query, tag_ids: List[int], tag_mode: TagMode = "any") -> list:
+    filters = []
+    if status is not None:
+        filters.append(ProjectCard.status == status)
+    if ts_query is not None:
+        filters.append(ProjectCard.search_vector.op("@@")(ts_query))
+    # both operators are served by the GIN index on tag_ids
+    if tag_ids and tag_mode == "all":
+        filters.append(ProjectCard.tag_ids.contains(tag_ids))
+    elif tag_ids:
+        filters.append(ProjectCard.tag_ids.overlap(tag_ids))
+    return filters
+
+def _page_order(published_at, id_, rank=None, backwards: bool = False) -> list:
+    if backwards:
+        return [published_at.asc().nullsfirst(), id_.asc()]
+    order = [published_at.desc().nullslast(), id_.desc()]
+    if rank is not None:
+        order.insert(0, rank.desc())
+    return order
+
+async def _hydrate_projects(db: AsyncSession, lang: Lang, ids: List[int], status: Optional[str]) -> List[ProjectListItem]:
+    if not ids:
+        return []
+    # the index may be older than the cards (another worker's write): never let it surface a project in the wrong status
+    stmt = LIST_ITEM.select(lang).where(ProjectCard.project_id.in_(ids), *_project_filters(status, None, []))
+    by_id = {row.id: LIST_ITEM.build(row) for row in (await db.execute(stmt)).all()}
+    return [by_id[pid] for pid in ids if pid in by_id]
+
+async def _count_projects(db: AsyncSession, lang: Lang, filters: list) -> int:
+    stmt = select(func.count()).select_from(ProjectCard).where(ProjectCard.lang == lang, *filters)
+    return (await db.execute(stmt)).scalar_one()
+
+def _keyset_after(published_at: Optional[datetime], pid: int):
+    # rows strictly after (published_at, id) in ORDER BY published_at DESC NULLS LAST, id DESC
+    if published_at is None:
+        return and_(ProjectCard.published_at.is_(None), ProjectCard.project_id < pid)
+    return or_(
+        ProjectCard.published_at < published_at,
+        and_(ProjectCard.published_at == published_at, ProjectCard.project_id < pid),
+        ProjectCard.published_at.is_(None),
+    )
+
+def _keyset_before(published_at: Optional[datetime], pid: int):
+    if published_at is None:
+        return or_(
+            ProjectCard.published_at.is_not(None),
+            and_(ProjectCard.published_at.is_(None), ProjectCard.project_id > pid),
+        )
+    return or_(
+        ProjectCard.published_at > published_at,
+        and_(ProjectCard.published_at == published_at, ProjectCard.project_id > pid),
+    )
+
 async def list_projects_paginated_v3(
     db: AsyncSession,
     lang: Lang,
@@ -370,151 +269,170 @@ async def list_projects_paginated_v3(
     status: Optional[str] = "published",
     q: Optional[str] = None,
     tag_ids: Optional[List[int]] = None,
+    cursor: Optional[str] = None,
+    sort: Optional[ProjectSort] = None,
+    include_total: bool = True,
+    tag_mode: TagMode = "any",
 ) -> Page[ProjectListItem]:
     page = max(int(page or 1), 1)
     page_size = max(1, min(int(page_size or 10), 100))
     offset = (page - 1) * page_size
 
+    seek = decode_cursor(cursor) if cursor else None
+    meta_page = None if seek else page
+
     q_norm = (q or "").strip()
     has_q = len(q_norm) > 0
-    like = f"%{q_norm}%"
+    ts_query = _search_query(lang, q_norm) if has_q else None
+
+    # searches rank by relevance unless the caller asks otherwise; cursors only follow the recent order
+    if sort is None:
+        sort = "relevance" if has_q and not seek else "recent"
+    if sort == "relevance" and not has_q:
+        sort = "recent"
+    if seek and sort != "recent":
+        raise ValueError("cursor pagination requires sort=recent")
 
     tag_ids = [int(x) for x in (tag_ids or []) if str(x).strip().isdigit()]
     tag_ids = list(dict.fromkeys(tag_ids))  # unique keep order (py3.7+)
 
-    count_stmt = (
-        select(func.count(func.distinct(Project.id)))
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-    )
-
-    if status is not None:
-        count_stmt = count_stmt.where(Project.status == status)
-
-    if has_q:
-        count_stmt = count_stmt.where(
-            or_(
-                Project.slug.ilike(like),
-                ProjectTranslation.title.ilike(like),
-                ProjectTranslation.summary.ilike(like),
-            )
-        )
-
-    if tag_ids:
-        count_stmt = (
-            count_stmt
-            .join(ProjectTag, ProjectTag.project_id == Project.id)
-            .where(ProjectTag.tag_id.in_(tag_ids))
-        )
-
-    total_items = (await db.execute(count_stmt)).scalar_one()
-    total_pages = 0 if total_items == 0 else math.ceil(total_items / page_size)
-
-    if total_pages > 0 and page > total_pages:
-        return Page(
-            items=[],
-            meta=PaginationMeta(
-                page=page,
-                page_size=page_size,
-                total_items=total_items,
-                total_pages=total_pages,
-            ),
-        )
-
-    ids_stmt = (
-        select(Project.id)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
+    # loading the index from a replica that is behind would hand stale sets to the whole worker: use SQL then
+    use_index = (
+        tag_ids and settings.TAG_INDEX_ENABLED and status == "published" and not has_q and not seek
+        and (tag_index.ready or await reads_are_current(db))
     )
-
-    if status is not None:
-        ids_stmt = ids_stmt.where(Project.status == status)
-
-    if has_q:
-        ids_stmt = ids_stmt.where(
-            or_(
-                Project.slug.ilike(like),
-                ProjectTranslation.title.ilike(like),
-                ProjectTranslation.summary.ilike(like),
-            )
-        )
-
-    if tag_ids:
-        ids_stmt = (
-            ids_stmt
-            .join(ProjectTag, ProjectTag.project_id == Project.id)
-            .where(ProjectTag.tag_id.in_(tag_ids))
-        )
-
-    ids_stmt = (
-        ids_stmt
-        .group_by(Project.id, Project.published_at)
-        .order_by(Project.published_at.desc().nullslast(), Project.id.desc())
-        .limit(page_size)
-        .offset(offset)
-    )
-
-    ids = [r[0] for r in (await db.execute(ids_stmt)).all()]
-
-    if not ids:
+    if use_index:
+        # tag filters on the public listing are set operations on the in-memory index;
+        # the database only hydrates the final page
+        await tag_index.ensure_loaded(db)
+        page_ids, total_items = tag_index.page(tag_index.match(lang, tag_ids, tag_mode), offset, page_size)
+        items = await _hydrate_projects(db, lang, page_ids, status)
+        has_next = offset + page_size < total_items
         return Page(
-            items=[],
+            items=items,
             meta=PaginationMeta(
                 page=page,
                 page_size=page_size,
                 total_items=total_items,
-                total_pages=total_pages,
+                total_pages=0 if total_items == 0 else math.ceil(total_items / page_size),
+                has_next=has_next,
+                next_cursor=encode_cursor(items[-1].published_at, items[-1].id, "next") if items and has_next else None,
+                prev_cursor=encode_cursor(items[0].published_at, items[0].id, "prev") if items and page > 1 else None,
             ),
         )
-    
-    data_stmt = (
-        select(Project, ProjectTranslation, Tag, TagTranslation)
-        .join(ProjectTranslation, (ProjectTranslation.project_id == Project.id) & (ProjectTranslation.lang == lang))
-        .outerjoin(ProjectTag, ProjectTag.project_id == Project.id)
-        .outerjoin(Tag, Tag.id == ProjectTag.tag_id)
-        .outerjoin(TagTranslation, (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang))
-        .where(Project.id.in_(ids))
-    )
 
-    rows = (await db.execute(data_stmt)).unique().all()
-
-    items_by_id: Dict[int, ProjectListItem] = {}
-    seen_tags: Dict[int, set[int]] = {}
-
-    for project, project_tr, tag, tag_tr in rows:
-        pid = project.id
-        if pid not in items_by_id:
-            items_by_id[pid] = ProjectListItem(
-                id=project.id,
-                slug=project.slug,
-                cover_image_url=getattr(project, "cover_image_url", None),
-                repo_url=getattr(project, "repo_url", None),
-                demo_url=getattr(project, "demo_url", None),
-                status=project.status,
-                published_at=project.published_at,
-                title=project_tr.title,
-                summary=getattr(project_tr, "summary", None),
-                tags=[],
+    filters = _project_filters(status, ts_query, tag_ids, tag_mode)
+
+    # unfiltered totals per (lang, status) come from the count cache, invalidated on every write;
+    # reads from a replica that is behind neither fill nor use it
+    count_key = (lang, status) if not has_q and not tag_ids and await reads_are_current(db) else None
+    total_items: Optional[int] = None
+    if include_total and count_key is not None:
+        total_items = _project_counts.get(count_key)
+    if include_total and total_items is None and seek:
+        # count(*) over () would only see the rows past the cursor
+        total_items = await _count_projects(db, lang, filters)
+        if count_key is not None:
+            _project_counts.set(count_key, total_items)
+    window_total = include_total and total_items is None
+
+    if total_items is not None and not seek:
+        total_pages = 0 if total_items == 0 else math.ceil(total_items / page_size)
+        if total_pages > 0 and page > total_pages:
+            return Page(
+                items=[],
+                meta=PaginationMeta(
+                    page=page,
+                    page_size=page_size,
+                    total_items=total_items,
+                    total_pages=total_pages,
+                    has_next=False,
+                ),
             )
-            seen_tags[pid] = set()
 
-        if tag is not None and tag.id not in seen_tags[pid]:
-            tag_name = (getattr(tag_tr, "name", None) if tag_tr is not None else None) or tag.slug
-            items_by_id[pid].tags.append(TagSimple(id=tag.id, slug=tag.slug, name=tag_name))
-            seen_tags[pid].add(tag.id)
-
-    items = list(items_by_id.values())
-    order_map = {pid: i for i, pid in enumerate(ids)}
-    items.sort(key=lambda x: order_map.get(x.id, 10**9))
+    rank = func.ts_rank_cd(ProjectCard.search_vector, ts_query) if sort == "relevance" else None
+    extra = []
+    if window_total:
+        extra.append(func.count().over().label("total_count"))
+    if rank is not None:
+        extra.append(rank.label("rank"))
+
+    stmt = LIST_ITEM.select(lang, *extra).where(*filters)
+
+    direction = "next"
+    if seek:
+        seek_published_at, seek_id, direction = seek
+        if direction == "next":
+            stmt = stmt.where(_keyset_after(seek_published_at, seek_id))
+        else:
+            # walk backwards, then flip the page back into display order
+            stmt = stmt.where(_keyset_before(seek_published_at, seek_id))
+    else:
+        stmt = stmt.offset(offset)
+
+    backwards = direction == "prev"
+    stmt = stmt.order_by(*_page_order(ProjectCard.published_at, ProjectCard.project_id, rank, backwards)).limit(page_size + 1)
+
+    rows = (await db.execute(stmt)).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    if window_total:
+        if rows:
+            total_items = rows[0].total_count
+        elif page == 1 and not seek:
+            total_items = 0
+        else:
+            total_items = await _count_projects(db, lang, filters)
+        if count_key is not None:
+            _project_counts.set(count_key, total_items)
+
+    total_pages: Optional[int] = None
+    if total_items is not None:
+        total_pages = 0 if total_items == 0 else math.ceil(total_items / page_size)
+
+    if seek:
+        has_next = has_more if direction == "next" else True
+        has_prev = has_more if direction == "prev" else True
+    else:
+        has_next = has_more
+        has_prev = page > 1
+
+    next_cursor = None
+    prev_cursor = None
+    if rows and sort == "recent":
+        if has_next:
+            next_cursor = encode_cursor(rows[-1].published_at, rows[-1].id, "next")
+        if has_prev:
+            prev_cursor = encode_cursor(rows[0].published_at, rows[0].id, "prev")
 
     return Page(
-        items=items,
+        items=LIST_ITEM.all(rows),
         meta=PaginationMeta(
-            page=page,
+            page=meta_page,
             page_size=page_size,
             total_items=total_items,
             total_pages=total_pages,
+            has_next=has_next,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         ),
     )
 
+def _render_translation(tr: ProjectTranslation) -> None:
+    """Re-render content_html/toc/reading time, skipping translations whose markdown is unchanged."""
+    digest = content_hash(tr.content_markdown)
+    if tr.content_hash == digest:
+        return
+    rendered = render_markdown(tr.content_markdown)
+    tr.content_html = rendered.html
+    tr.content_toc = rendered.toc
+    tr.reading_minutes = rendered.reading_minutes
+    tr.content_hash = digest
+
+
 def _dedupe_project_translations(translations) -> Dict[str, "ProjectTranslationIn"]:
     seen: Dict[str, "ProjectTranslationIn"] = {}
     for tr in translations:
@@ -532,6 +450,8 @@ async def update_project_by_slug(
     project = (await db.execute(select(Project).where(Project.slug == slug))).scalar_one_or_none()
     if not project:
         return None
+    # media referenced before and after the change get recounted
+    media = media_keys(project.cover_image_url)
 
     if payload.status is not None:
         project.status = payload.status
@@ -576,20 +496,23 @@ async def update_project_by_slug(
         current_by_lang: Dict[str, ProjectTranslation] = {t.lang: t for t in current_rows}
 
         for lang, tr in tr_map.items():
+            media |= media_keys(tr.content_markdown)
             if lang in current_by_lang:
+                media |= media_keys(current_by_lang[lang].content_markdown)
                 current_by_lang[lang].title = tr.title
                 current_by_lang[lang].summary = tr.summary
                 current_by_lang[lang].content_markdown = tr.content_markdown
+                _render_translation(current_by_lang[lang])
             else:
-                db.add(
-                    ProjectTranslation(
-                        project_id=project.id,
-                        lang=tr.lang,
-                        title=tr.title,
-                        summary=tr.summary,
-                        content_markdown=tr.content_markdown,
-                    )
+                tr_model = ProjectTranslation(
+                    project_id=project.id,
+                    lang=tr.lang,
+                    title=tr.title,
+                    summary=tr.summary,
+                    content_markdown=tr.content_markdown,
                 )
+                _render_translation(tr_model)
+                db.add(tr_model)
 
     if payload.tag_ids is not None:
         tag_ids: List[int] = list({int(x) for x in payload.tag_ids})
@@ -603,7 +526,16 @@ async def update_project_by_slug(
         for tid in tag_ids:
             db.add(ProjectTag(project_id=project.id, tag_id=tid))
 
+    # onupdate only fires when a projects column changed; translation and tag edits count too
+    project.updated_at = func.now()
+    await refresh_project_cards(db, [project.id])
+    await refresh_media_refs(db, media | media_keys(project.cover_image_url))
+    await bump_versions(db, PROJECTS)
     await db.commit()
+    invalidate_project_counts()
+    response_cache.evict(PROJECTS_LIST, project_dep(slug))
+    await tag_index.refresh_project(db, project.id)
+    await catalog.refresh([project.id], {PROJECTS: 1})
     await db.refresh(project)
 
     tr_rows = (
@@ -655,6 +587,11 @@ async def delete_project_by_slug(db: AsyncSession, slug: str) -> bool:
     if not project_obj:
         return False
 
+    markdown = (
+        await db.execute(select(ProjectTranslation.content_markdown).where(ProjectTranslation.project_id == project_obj.id))
+    ).scalars().all()
+    media = media_keys(project_obj.cover_image_url, *markdown)
+
     await db.execute(
         delete(ProjectTag).where(ProjectTag.project_id == project_obj.id)
     )
@@ -663,7 +600,15 @@ async def delete_project_by_slug(db: AsyncSession, slug: str) -> bool:
         delete(ProjectTranslation).where(ProjectTranslation.project_id == project_obj.id)
     )
 
+    await db.execute(delete(ProjectCard).where(ProjectCard.project_id == project_obj.id))
     await db.delete(project_obj)
+    await db.flush()
+    await refresh_media_refs(db, media)
 
+    await bump_versions(db, PROJECTS)
     await db.commit()
+    invalidate_project_counts()
+    response_cache.evict(PROJECTS_LIST, project_dep(slug))
+    tag_index.remove_project(project_obj.id)
+    await catalog.refresh([project_obj.id], {PROJECTS: 1})
     return True
\ No newline at end of file
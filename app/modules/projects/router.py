@@ -1,11 +1,18 @@
+from datetime import datetime
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.deps import get_db
-from app.schemas.common import Lang, ApiResponse, Page
-from app.modules.projects.schemas import ProjectListItem, ProjectDetail, ProjectCreate, ProjectRead, ProjectUpdate
+from app.core.http_cache import is_not_modified, not_modified, set_validators
+from app.core.responses import api_response
+from app.core.response_cache import response_cache, cache_key, tag_deps, PROJECTS_LIST, project_dep
+from app.db.deps import get_db, get_read_db
+from app.db.versions import reads_are_current, session_versions, validators_for, version_tag, PROJECTS, TAGS
+from app.core.ndjson import NDJSON_BODY, iter_ndjson
+from app.schemas.common import Lang, ApiResponse, BulkResult, Page
+from app.modules.projects.schemas import ProjectSort, TagMode, ProjectListItem, ProjectDetail, ProjectCreate, ProjectRead, ProjectUpdate
 from app.modules.projects.repository import (
     get_project_by_slug,
     list_projects_paginated_v3,
@@ -13,6 +20,9 @@ from app.modules.projects.repository import (
     update_project_by_slug,
     delete_project_by_slug
 )
+from app.modules.projects.bulk import bulk_create_projects
+from app.modules.projects.catalog import catalog
+from app.modules.projects.export import stream_project_export
 from app.api.deps import require_admin
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -30,30 +40,94 @@ async def project_create(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", response_model=ApiResponse[BulkResult], dependencies=[Depends(require_admin)], openapi_extra=NDJSON_BODY)
+async def projects_bulk_create(
+    request: Request,
+    batch_size: int = Query(500, ge=1, le=5000, description="records per INSERT/commit"),
+    db: AsyncSession = Depends(get_db),
+):
+    """One ProjectCreate JSON object per line; returns a result for every line."""
+    result = await bulk_create_projects(db, iter_ndjson(request.stream()), batch_size=batch_size)
+    return ApiResponse(data=result)
+
+
 @router.get("", response_model=ApiResponse[Page[ProjectListItem]] )
 async def projects_list(
+    request: Request,
+    response: Response,
     lang: Lang = Query("vi"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     status: Optional[str] = Query("published"),
     q: Optional[str] = Query(None, min_length=1),
     tag_ids: Optional[str] = Query(None, description="Comma-separated tag ids, e.g. 1,2,3"),
-    db: AsyncSession = Depends(get_db),
+    tag_mode: TagMode = Query("any", description="any: at least one of tag_ids, all: every tag in tag_ids"),
+    cursor: Optional[str] = Query(None, description="meta.next_cursor / meta.prev_cursor of a previous page; overrides page"),
+    sort: Optional[ProjectSort] = Query(None, description="relevance (default when q is set) or recent"),
+    include_total: bool = Query(True, description="false skips the count query; use meta.has_next instead"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     ids: Optional[List[int]] = None
     if tag_ids:
         ids = [int(x) for x in tag_ids.split(",") if x.strip().isdigit()]
 
-    page_obj = await list_projects_paginated_v3(
-        db=db,
-        lang=lang,
-        page=page,
-        page_size=page_size,
-        status=status,
-        q=q,
-        tag_ids=ids,
+    # the published catalog is served from memory; searches still go to Postgres
+    snapshot = catalog.current() if status == "published" and not q else None
+
+    # tag names are embedded in items, so tag writes change list ETags too
+    versions = snapshot.versions if snapshot is not None else await session_versions(db)
+    key = cache_key(
+        "projects.list",
+        lang=lang, page=page, page_size=page_size, status=status, q=(q or "").lower() or None,
+        tag_ids=ids or None, tag_mode=tag_mode if ids else None, cursor=cursor, sort=sort, include_total=include_total,
+        versions=version_tag(versions, PROJECTS, TAGS),
     )
-    return ApiResponse(data=page_obj)
+    etag, last_modified = validators_for(versions, key, PROJECTS, TAGS)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
+
+    if snapshot is not None:
+        try:
+            page_obj = snapshot.list_projects(
+                lang=lang,
+                page=page,
+                page_size=page_size,
+                tag_ids=list(dict.fromkeys(ids or [])),
+                cursor=cursor,
+                include_total=include_total,
+                tag_mode=tag_mode,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return api_response(page_obj, response)
+
+    cached = response_cache.get(key)
+    if cached is not None:
+        return api_response(cached, response)
+    cacheable = await reads_are_current(db)
+
+    try:
+        page_obj = await list_projects_paginated_v3(
+            db=db,
+            lang=lang,
+            page=page,
+            page_size=page_size,
+            status=status,
+            q=q,
+            tag_ids=ids,
+            cursor=cursor,
+            sort=sort,
+            include_total=include_total,
+            tag_mode=tag_mode,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    item_tags = [t.id for item in page_obj.items for t in item.tags]
+    if cacheable:
+        response_cache.set(key, page_obj, deps=[PROJECTS_LIST, *tag_deps(item_tags + (ids or []))])
+    return api_response(page_obj, response)
 
 @router.get("/admin", response_model=ApiResponse[Page[ProjectListItem]], dependencies=[Depends(require_admin)])
 async def projects_admin_list(
@@ -63,34 +137,89 @@ async def projects_admin_list(
     status: Optional[str] = Query(None),  # None = all
     q: Optional[str] = Query(None, min_length=1),
     tag_ids: Optional[str] = Query(None),
+    tag_mode: TagMode = Query("any"),
+    cursor: Optional[str] = Query(None),
+    sort: Optional[ProjectSort] = Query(None),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
 ):
     ids: Optional[List[int]] = None
     if tag_ids:
         ids = [int(x) for x in tag_ids.split(",") if x.strip().isdigit()]
 
-    page_obj = await list_projects_paginated_v3(
-        db=db,
-        lang=lang,
-        page=page,
-        page_size=page_size,
-        status=status,   # None => all
-        q=q,
-        tag_ids=ids,
+    try:
+        page_obj = await list_projects_paginated_v3(
+            db=db,
+            lang=lang,
+            page=page,
+            page_size=page_size,
+            status=status,   # None => all
+            q=q,
+            tag_ids=ids,
+            cursor=cursor,
+            sort=sort,
+            include_total=include_total,
+            tag_mode=tag_mode,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return api_response(page_obj)
+
+# must stay above /{slug}
+@router.get(
+    "/export",
+    dependencies=[Depends(require_admin)],
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}, "description": "One ProjectExport per line"}},
+)
+async def projects_export(
+    status: Optional[str] = Query(None, description="None = all statuses"),
+    lang: Optional[Lang] = Query(None, description="only this translation; projects without it are skipped"),
+    updated_since: Optional[datetime] = Query(
+        None,
+        description="projects.updated_at >= this timestamp. Set by every change through the API: the project's "
+        "fields, translations and tags, and renames or deletes of a tag it carries. Deleted projects and "
+        "direct SQL edits are not seen.",
+    ),
+):
+    return StreamingResponse(
+        stream_project_export(status=status, lang=lang, updated_since=updated_since),
+        media_type="application/x-ndjson",
     )
-    return ApiResponse(data=page_obj)
 
 @router.get("/{slug}", response_model=ApiResponse[ProjectDetail])
 async def project_detail(
+    request: Request,
+    response: Response,
     slug: str,
     lang: Lang = Query("vi"),
     status: Optional[str] = Query("published"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    project = await get_project_by_slug(db, slug=slug, lang=lang, status=status)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return ApiResponse(data=project)
+    snapshot = catalog.current() if status == "published" else None
+    versions = snapshot.versions if snapshot is not None else await session_versions(db)
+    key = cache_key("projects.detail", slug=slug, lang=lang, status=status, versions=version_tag(versions, PROJECTS, TAGS))
+    etag, last_modified = validators_for(versions, key, PROJECTS, TAGS)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    if snapshot is not None:
+        project = snapshot.detail(slug, lang)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        set_validators(response, etag, last_modified)
+        return api_response(project, response)
+
+    project = response_cache.get(key)
+    if project is None:
+        cacheable = await reads_are_current(db)
+        project = await get_project_by_slug(db, slug=slug, lang=lang, status=status)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if cacheable:
+            response_cache.set(key, project, deps=[project_dep(slug), *tag_deps(t.id for t in project.tags)])
+    set_validators(response, etag, last_modified)
+    return api_response(project, response)
 
 @router.patch("/{slug}", response_model=ApiResponse[ProjectRead])
 async def project_update(
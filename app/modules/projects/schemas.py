@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import Field
 from app.schemas.common import BaseSchema, TimestampMixin, Lang, IDSchema
-from app.modules.tags.schemas import TagSimple
+from app.modules.tags.schemas import TagSimple, TagTranslationIn
+
+ProjectSort = Literal["recent", "relevance"]
+TagMode = Literal["any", "all"]
 
 class ProjectTranslationBase(BaseSchema):
     lang: Lang = Field(..., example="vi")
@@ -55,13 +58,32 @@ class ProjectListItem(BaseSchema):
     summary: Optional[str] = Field(None)
     tags: List[TagSimple] = Field(default_factory=list)
 
+class TocEntry(BaseSchema):
+    level: int
+    id: str
+    text: str
+
 class ProjectDetail(ProjectListItem):
     content_markdown: Optional[str] = None
+    content_html: Optional[str] = None
+    toc: List[TocEntry] = Field(default_factory=list)
+    reading_minutes: Optional[int] = None
 
 class ProjectRead(ProjectBase, IDSchema, TimestampMixin):
     translations: List[ProjectTranslationRead] = Field(default_factory=list)
     tags: List[TagSimple] = Field(default_factory=list)
 
+class ProjectExportTag(BaseSchema):
+    id: int
+    slug: str
+    translations: List[TagTranslationIn] = Field(default_factory=list)
+
+class ProjectExport(ProjectBase, IDSchema, TimestampMixin):
+    """One line of GET /projects/export; also a valid ProjectCreate line for POST /projects/bulk."""
+    translations: List[ProjectTranslationRead] = Field(default_factory=list)
+    tags: List[ProjectExportTag] = Field(default_factory=list)
+    tag_ids: List[int] = Field(default_factory=list)
+
 class ProjectTranslationIn(BaseSchema):
     lang: Lang
     title: str
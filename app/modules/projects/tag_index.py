@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.project_tag import ProjectTag
+from app.models.project_translation import ProjectTranslation
+
+# sort key mirroring ORDER BY published_at DESC NULLS LAST, id DESC (ascending tuple order)
+SortKey = Tuple[int, float, int]
+
+
+def sort_key(published_at: Optional[datetime], pid: int) -> SortKey:
+    if published_at is None:
+        return (1, 0.0, -pid)
+    return (0, -published_at.timestamp(), -pid)
+
+
+def _bits(mask: int) -> List[int]:
+    """Positions of the set bits, i.e. the project ids in a bitmap."""
+    s = bin(mask)
+    top = len(s) - 1
+    ids = []
+    i = s.find("1", 2)
+    while i != -1:
+        ids.append(top - i)
+        i = s.find("1", i + 1)
+    return ids
+
+
+class TagIndex:
+    """
+    Bitmaps of published project ids: one per tag and one per translation lang.
+    Bit n set => project id n is in the set, so multi-tag filters are plain & / |.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._tag_bits: Dict[int, int] = {}
+        self._lang_bits: Dict[str, int] = {}
+        self._sort_keys: Dict[int, SortKey] = {}
+        self._project_tags: Dict[int, Tuple[int, ...]] = {}
+        self._project_langs: Dict[int, Tuple[str, ...]] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        if self.ready:
+            return
+        async with self._lock:
+            if not self.ready:
+                await self._load(db)
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    async def _load(self, db: AsyncSession) -> None:
+        projects = (
+            await db.execute(select(Project.id, Project.published_at).where(Project.status == "published"))
+        ).all()
+        langs = (
+            await db.execute(
+                select(ProjectTranslation.project_id, ProjectTranslation.lang)
+                .join(Project, Project.id == ProjectTranslation.project_id)
+                .where(Project.status == "published")
+            )
+        ).all()
+        links = (
+            await db.execute(
+                select(ProjectTag.project_id, ProjectTag.tag_id)
+                .join(Project, Project.id == ProjectTag.project_id)
+                .where(Project.status == "published")
+            )
+        ).all()
+
+        sort_keys = {pid: sort_key(published_at, pid) for pid, published_at in projects}
+        project_langs: Dict[int, List[str]] = {}
+        lang_bits: Dict[str, int] = {}
+        for pid, lang in langs:
+            project_langs.setdefault(pid, []).append(lang)
+            lang_bits[lang] = lang_bits.get(lang, 0) | (1 << pid)
+        project_tags: Dict[int, List[int]] = {}
+        tag_bits: Dict[int, int] = {}
+        for pid, tid in links:
+            project_tags.setdefault(pid, []).append(tid)
+            tag_bits[tid] = tag_bits.get(tid, 0) | (1 << pid)
+
+        # swap everything in one go so concurrent readers never see a half-built index
+        self._sort_keys = sort_keys
+        self._project_langs = {pid: tuple(v) for pid, v in project_langs.items()}
+        self._project_tags = {pid: tuple(v) for pid, v in project_tags.items()}
+        self._lang_bits = lang_bits
+        self._tag_bits = tag_bits
+        self._loaded_at = time.monotonic()
+
+    def _unset(self, pid: int) -> None:
+        bit = 1 << pid
+        for tid in self._project_tags.pop(pid, ()):
+            self._tag_bits[tid] = self._tag_bits.get(tid, 0) & ~bit
+        for lang in self._project_langs.pop(pid, ()):
+            self._lang_bits[lang] = self._lang_bits.get(lang, 0) & ~bit
+        self._sort_keys.pop(pid, None)
+
+    async def refresh_project(self, db: AsyncSession, pid: int) -> None:
+        if self._loaded_at is None:
+            return
+        row = (
+            await db.execute(select(Project.status, Project.published_at).where(Project.id == pid))
+        ).one_or_none()
+        if row is None or row.status != "published":
+            self._unset(pid)
+            return
+        langs = (
+            await db.execute(select(ProjectTranslation.lang).where(ProjectTranslation.project_id == pid))
+        ).scalars().all()
+        tag_ids = (
+            await db.execute(select(ProjectTag.tag_id).where(ProjectTag.project_id == pid))
+        ).scalars().all()
+
+        # no awaits from here on: readers see either the old or the new state of this project
+        self._unset(pid)
+        bit = 1 << pid
+        self._sort_keys[pid] = sort_key(row.published_at, pid)
+        self._project_langs[pid] = tuple(langs)
+        self._project_tags[pid] = tuple(tag_ids)
+        for lang in langs:
+            self._lang_bits[lang] = self._lang_bits.get(lang, 0) | bit
+        for tid in tag_ids:
+            self._tag_bits[tid] = self._tag_bits.get(tid, 0) | bit
+
+    def remove_project(self, pid: int) -> None:
+        if self._loaded_at is not None:
+            self._unset(pid)
+
+    def remove_tag(self, tag_id: int) -> None:
+        mask = self._tag_bits.pop(tag_id, 0)
+        for pid in _bits(mask):
+            self._project_tags[pid] = tuple(t for t in self._project_tags.get(pid, ()) if t != tag_id)
+
+    def match(self, lang: str, tag_ids: Sequence[int], mode: str = "any") -> int:
+        if mode == "all":
+            mask = -1
+            for tid in tag_ids:
+                mask &= self._tag_bits.get(tid, 0)
+        else:
+            mask = 0
+            for tid in tag_ids:
+                mask |= self._tag_bits.get(tid, 0)
+        return mask & self._lang_bits.get(lang, 0)
+
+    def page(self, mask: int, offset: int, limit: int) -> Tuple[List[int], int]:
+        """(ids of the requested slice in display order, total matches)."""
+        ids = _bits(mask)
+        keys = self._sort_keys
+        if offset + limit < len(ids) // 4:
+            ordered = heapq.nsmallest(offset + limit, ids, key=keys.__getitem__)
+        else:
+            ordered = sorted(ids, key=keys.__getitem__)
+        return ordered[offset:offset + limit], len(ids)
+
+
+tag_index = TagIndex(ttl=settings.TAG_INDEX_TTL_SECONDS)
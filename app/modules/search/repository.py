@@ -0,0 +1,78 @@
+from sqlalchemy import select, func, or_, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.common import Lang
+from app.modules.search.schemas import SuggestItem, Suggestions
+from app.models.project import Project
+from app.models.project_translation import ProjectTranslation
+from app.models.tag import Tag
+from app.models.tag_translation import TagTranslation
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+async def suggest(db: AsyncSession, lang: Lang, q: str, limit: int = 5) -> Suggestions:
+    """
+    Top-N project titles + tag names cho typeahead, trong 1 round trip.
+    Cả ILIKE '%q%' lẫn toán tử % (fuzzy) đều dùng được GIN trigram index.
+    """
+    q_norm = q.strip()
+    limit = max(1, min(int(limit), 20))
+    if not q_norm:
+        return Suggestions()
+
+    like = f"%{_escape_like(q_norm)}%"
+    prefix = f"{_escape_like(q_norm)}%"
+
+    title = ProjectTranslation.title
+    project_score = func.similarity(title, q_norm)
+    projects_stmt = (
+        select(
+            literal("project").label("kind"),
+            Project.id.label("id"),
+            Project.slug.label("slug"),
+            title.label("label"),
+            project_score.label("score"),
+        )
+        .join(Project, Project.id == ProjectTranslation.project_id)
+        .where(
+            ProjectTranslation.lang == lang,
+            Project.status == "published",
+            or_(title.ilike(like, escape="\\"), title.op("%")(q_norm)),
+        )
+        .order_by(title.ilike(prefix, escape="\\").desc(), project_score.desc(), Project.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+
+    name = TagTranslation.name
+    tag_score = func.similarity(name, q_norm)
+    tags_stmt = (
+        select(
+            literal("tag").label("kind"),
+            Tag.id.label("id"),
+            Tag.slug.label("slug"),
+            name.label("label"),
+            tag_score.label("score"),
+        )
+        .join(Tag, Tag.id == TagTranslation.tag_id)
+        .where(
+            TagTranslation.lang == lang,
+            or_(name.ilike(like, escape="\\"), name.op("%")(q_norm)),
+        )
+        .order_by(name.ilike(prefix, escape="\\").desc(), tag_score.desc(), Tag.id.asc())
+        .limit(limit)
+        .subquery()
+    )
+
+    stmt = union_all(select(projects_stmt), select(tags_stmt))
+    rows = (await db.execute(stmt)).all()
+
+    result = Suggestions()
+    for row in rows:
+        item = SuggestItem(id=row.id, slug=row.slug, label=row.label, score=float(row.score or 0))
+        if row.kind == "project":
+            result.projects.append(item)
+        else:
+            result.tags.append(item)
+    return result
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.deps import get_read_db
+from app.schemas.common import Lang, ApiResponse
+from app.modules.search.schemas import Suggestions
+from app.modules.search.repository import suggest
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/suggest", response_model=ApiResponse[Suggestions])
+async def search_suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    lang: Lang = Query("vi"),
+    limit: int = Query(5, ge=1, le=20),
+    db: AsyncSession = Depends(get_read_db),
+):
+    data = await suggest(db, lang=lang, q=q, limit=limit)
+    return ApiResponse(data=data)
@@ -0,0 +1,12 @@
+from typing import List
+from pydantic import Field
+from app.schemas.common import BaseSchema, IDSchema
+
+class SuggestItem(IDSchema):
+    slug: str
+    label: str = Field(..., description="Translated project title or tag name")
+    score: float = Field(0.0, description="Trigram similarity to the query")
+
+class Suggestions(BaseSchema):
+    projects: List[SuggestItem] = Field(default_factory=list)
+    tags: List[SuggestItem] = Field(default_factory=list)
@@ -0,0 +1,82 @@
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.ndjson import batched, validated
+from app.core.response_cache import response_cache, TAGS_LIST
+from app.db.versions import bump_versions, TAGS
+from app.models.tag import Tag
+from app.models.tag_translation import TagTranslation
+from app.modules.tags.repository import invalidate_tag_counts
+from app.modules.tags.schemas import TagCreate
+from app.schemas.common import BulkLineResult, BulkResult
+
+
+async def _insert_batch(db: AsyncSession, batch: List[Tuple[int, TagCreate]], result: BulkResult) -> None:
+    slugs = [t.slug for _, t in batch]
+    existing = set((await db.execute(select(Tag.slug).where(Tag.slug.in_(slugs)))).scalars().all())
+
+    rows: List[Tuple[int, TagCreate]] = []
+    for line_no, t in batch:
+        if t.slug in existing:
+            result.results.append(BulkLineResult(line=line_no, ok=False, slug=t.slug, error="slug already exists"))
+        else:
+            rows.append((line_no, t))
+    if not rows:
+        return
+
+    try:
+        inserted = (await db.execute(insert(Tag).returning(Tag.id, Tag.slug), [{"slug": t.slug} for _, t in rows])).all()
+        ids: Dict[str, int] = {r.slug: r.id for r in inserted}
+        translations = [
+            {"tag_id": ids[t.slug], "lang": tr.lang, "name": tr.name}
+            for _, t in rows
+            for tr in t.translations
+        ]
+        if translations:
+            await db.execute(insert(TagTranslation), translations)
+        await bump_versions(db, TAGS)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        error = f"batch rejected: {e.orig}"
+        result.results.extend(BulkLineResult(line=line_no, ok=False, slug=t.slug, error=error) for line_no, t in rows)
+        return
+
+    result.results.extend(BulkLineResult(line=line_no, ok=True, id=ids[t.slug], slug=t.slug) for line_no, t in rows)
+
+
+async def bulk_create_tags(db: AsyncSession, lines: AsyncIterator[Tuple[int, Any]], batch_size: int = 500) -> BulkResult:
+    """
+    Tạo tag từ NDJSON (mỗi dòng một TagCreate); mỗi batch hợp lệ được insert và commit riêng.
+    """
+    result = BulkResult()
+    seen: Set[str] = set()
+
+    async def valid_records():
+        async for line_no, record in validated(lines, TagCreate):
+            error = record if isinstance(record, str) else None
+            if error is None:
+                langs = [tr.lang for tr in record.translations]
+                if len(set(langs)) != len(langs):
+                    error = "duplicate translation lang"
+                elif record.slug in seen:
+                    error = "duplicate slug in this import"
+            if error is not None:
+                result.results.append(BulkLineResult(line=line_no, ok=False, slug=getattr(record, "slug", None), error=error))
+                continue
+            seen.add(record.slug)
+            yield line_no, record
+
+    async for batch in batched(valid_records(), batch_size):
+        await _insert_batch(db, batch, result)
+
+    result.results.sort(key=lambda r: r.line)
+    result.created = sum(1 for r in result.results if r.ok)
+    result.failed = len(result.results) - result.created
+    if result.created:
+        invalidate_tag_counts()
+        response_cache.evict(TAGS_LIST)
+    return result
@@ -5,12 +5,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.response_cache import response_cache, TAGS_LIST, tag_dep
+from app.db.versions import bump_versions, TAGS
 from app.schemas.common import Lang, Page, PaginationMeta
+from app.modules.projects.cards import project_ids_for_tag, refresh_project_cards, touch_projects
+from app.modules.projects.catalog import catalog
+from app.modules.projects.tag_index import tag_index
 from app.modules.tags.schemas import TagSimple
 from app.models.tag import Tag
 from app.models.tag_translation import TagTranslation
 from app.modules.tags.schemas import TagSimple, TagCreate, TagRead, TagTranslationIn, TagUpdate, TagTranslationRead
 
+_tag_counts = TTLCache(maxsize=8, ttl=settings.COUNT_CACHE_TTL_SECONDS)
+registry.register_cache("tag_counts", _tag_counts)
+
+def invalidate_tag_counts() -> None:
+    _tag_counts.clear()
+
 def _dedupe_translations(translations: List[TagTranslationIn]) -> Dict[Lang, str]:
     """
     Dedupe theo lang. Nếu payload gửi trùng lang => raise ValueError.
@@ -84,10 +98,15 @@ async def create_tag(db: AsyncSession, payload: TagCreate) -> TagRead:
         )
 
     try:
+        await bump_versions(db, TAGS)
         await db.commit()
     except IntegrityError:
         await db.rollback()
         raise ValueError("slug already exists")
+    invalidate_tag_counts()
+    response_cache.evict(TAGS_LIST)
+    # no project carries it yet: only the catalog's versions move
+    await catalog.refresh((), {TAGS: 1})
 
     tag = await db.get(Tag, tag.id, options=[selectinload(Tag.tag_translations)])
 
@@ -125,10 +144,18 @@ async def update_tag(db: AsyncSession, tag_id: int, payload: TagUpdate) -> Optio
                 db.add(TagTranslation(tag_id=tag.id, lang=lang, name=name))
 
     try:
+        # cards embed the tag's slug and localized names
+        affected = await project_ids_for_tag(db, tag_id)
+        await touch_projects(db, affected)
+        await refresh_project_cards(db, affected)
+        await bump_versions(db, TAGS)
         await db.commit()
     except IntegrityError:
         await db.rollback()
         raise ValueError("slug already exists")
+    # tag names are embedded in project items, so those entries go too
+    response_cache.evict(TAGS_LIST, tag_dep(tag_id))
+    await catalog.refresh(affected, {TAGS: 1})
 
     await db.refresh(tag)
 
@@ -141,11 +168,19 @@ async def delete_tag(db: AsyncSession, tag_id: int) -> bool:
     if not tag:
         return False
 
+    affected = await project_ids_for_tag(db, tag_id)
     await db.execute(text("DELETE FROM project_tags WHERE tag_id = :tid"), {"tid": tag_id})
     await db.execute(delete(TagTranslation).where(TagTranslation.tag_id == tag_id))
     await db.delete(tag)
+    await touch_projects(db, affected)
+    await refresh_project_cards(db, affected)
+    await bump_versions(db, TAGS)
 
     await db.commit()
+    invalidate_tag_counts()
+    response_cache.evict(TAGS_LIST, tag_dep(tag_id))
+    tag_index.remove_tag(tag_id)
+    await catalog.refresh(affected, {TAGS: 1})
     return True
 
 async def list_tags_paginated(
@@ -154,6 +189,7 @@ async def list_tags_paginated(
     page: int = 1,
     page_size: int = 10,
     q: Optional[str] = None,
+    include_total: bool = True,
 ) -> Page[TagSimple]:
     page = max(1, int(page))
     page_size = max(1, min(100, int(page_size)))
@@ -163,44 +199,55 @@ async def list_tags_paginated(
     has_q = len(q_norm) > 0
     like = f"%{q_norm}%"
 
-    count_stmt = (
-        select(func.count(func.distinct(Tag.id)))
-        .outerjoin(
-            TagTranslation,
-            (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang),
-        )
-    )
-
-    if has_q:
-        count_stmt = count_stmt.where(
-            or_(
-                Tag.slug.ilike(like),
-                TagTranslation.name.ilike(like),
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+    if include_total:
+        # số tag không phụ thuộc lang (outer join), nên khi không lọc chỉ cần 1 key
+        total_items = None if has_q else _tag_counts.get("all")
+
+        if total_items is None:
+            count_stmt = (
+                select(func.count(func.distinct(Tag.id)))
+                .outerjoin(
+                    TagTranslation,
+                    (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang),
+                )
             )
-        )
 
-    total_items = (await db.execute(count_stmt)).scalar_one()
-    total_pages = math.ceil(total_items / page_size) if total_items > 0 else 0
-
-    if total_pages > 0 and page > total_pages:
-        return Page(
-            items=[],
-            meta=PaginationMeta(
-                page=page,
-                page_size=page_size,
-                total_items=total_items,
-                total_pages=total_pages,
-            ),
-        )
+            if has_q:
+                count_stmt = count_stmt.where(
+                    or_(
+                        Tag.slug.ilike(like),
+                        TagTranslation.name.ilike(like),
+                    )
+                )
+
+            total_items = (await db.execute(count_stmt)).scalar_one()
+            if not has_q:
+                _tag_counts.set("all", total_items)
+
+        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 0
+
+        if total_pages > 0 and page > total_pages:
+            return Page(
+                items=[],
+                meta=PaginationMeta(
+                    page=page,
+                    page_size=page_size,
+                    total_items=total_items,
+                    total_pages=total_pages,
+                    has_next=False,
+                ),
+            )
 
     items_stmt = (
-        select(Tag, TagTranslation)
+        select(Tag.id, Tag.slug, TagTranslation.name)
         .outerjoin(
             TagTranslation,
             (TagTranslation.tag_id == Tag.id) & (TagTranslation.lang == lang),
         )
         .order_by(Tag.id.asc())
-        .limit(page_size)
+        .limit(page_size + 1)
         .offset(offset)
     )
 
@@ -212,15 +259,17 @@ async def list_tags_paginated(
             )
         )
 
-    rows: List[Tuple[Tag, Optional[TagTranslation]]] = (await db.execute(items_stmt)).all()
+    rows = (await db.execute(items_stmt)).all()
+    has_next = len(rows) > page_size
 
+    # các cột lấy thẳng từ DB nên không cần validate lại
     items = [
-        TagSimple(
-            id=tag.id,
-            slug=tag.slug,
-            name=(tr.name if tr else None) or tag.slug,  # fallback
+        TagSimple.model_construct(
+            id=row.id,
+            slug=row.slug,
+            name=row.name or row.slug,  # fallback
         )
-        for tag, tr in rows
+        for row in rows[:page_size]
     ]
 
     return Page(
@@ -230,5 +279,6 @@ async def list_tags_paginated(
             page_size=page_size,
             total_items=total_items,
             total_pages=total_pages,
+            has_next=has_next,
         ),
-    )
\ No newline at end of file
+    )
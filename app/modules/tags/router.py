@@ -1,11 +1,18 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.deps import get_db
-from app.schemas.common import Lang, ApiResponse, Page
+from app.core.http_cache import is_not_modified, not_modified, set_validators
+from app.core.responses import api_response
+from app.core.response_cache import response_cache, cache_key, TAGS_LIST
+from app.db.deps import get_db, get_read_db
+from app.db.versions import reads_are_current, session_versions, validators_for, version_tag, TAGS
+from app.core.ndjson import NDJSON_BODY, iter_ndjson
+from app.schemas.common import Lang, ApiResponse, BulkResult, Page
 from app.modules.tags.schemas import TagSimple, TagCreate, TagRead, TagUpdate
+from app.api.deps import require_admin
+from app.modules.tags.bulk import bulk_create_tags
 from app.modules.tags.repository import (
     list_tags_paginated,
     create_tag,
@@ -19,14 +26,29 @@ router = APIRouter(prefix="/tags", tags=["tags"])
 
 @router.get("", response_model=ApiResponse[Page[TagSimple]])
 async def tags_list(
+    request: Request,
+    response: Response,
     lang: Lang = Query("vi"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     q: Optional[str] = Query(None, min_length=1),
-    db: AsyncSession = Depends(get_db),
+    include_total: bool = Query(True, description="false skips the count query; use meta.has_next instead"),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    data = await list_tags_paginated(db, lang=lang, page=page, page_size=page_size, q=q)
-    return ApiResponse(data=data)
+    versions = await session_versions(db)
+    key = cache_key("tags.list", lang=lang, page=page, page_size=page_size, q=q, include_total=include_total, versions=version_tag(versions, TAGS))
+    etag, last_modified = validators_for(versions, key, TAGS)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
+
+    data = response_cache.get(key)
+    if data is None:
+        cacheable = await reads_are_current(db)
+        data = await list_tags_paginated(db, lang=lang, page=page, page_size=page_size, q=q, include_total=include_total)
+        if cacheable:
+            response_cache.set(key, data, deps=[TAGS_LIST])
+    return api_response(data, response)
 
 
 @router.post("", response_model=ApiResponse[TagRead], status_code=201)
@@ -41,10 +63,21 @@ async def tags_create(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", response_model=ApiResponse[BulkResult], dependencies=[Depends(require_admin)], openapi_extra=NDJSON_BODY)
+async def tags_bulk_create(
+    request: Request,
+    batch_size: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    """One TagCreate JSON object per line; returns a result for every line."""
+    result = await bulk_create_tags(db, iter_ndjson(request.stream()), batch_size=batch_size)
+    return ApiResponse(data=result)
+
+
 @router.get("/{tag_id}", response_model=ApiResponse[TagRead])
 async def tags_get(
     tag_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     tag = await get_tag(db, tag_id)
     if not tag:
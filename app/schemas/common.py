@@ -19,15 +19,30 @@ class ApiResponse(BaseSchema, Generic[T]):
     data: Optional[T] = None
 
 class PaginationMeta(BaseSchema):
-    page: int = 1
+    page: Optional[int] = Field(1, description="Null when the page was requested by cursor")
     page_size: int = 10
-    total_items: int = 0
-    total_pages: int = 0
+    total_items: Optional[int] = Field(0, description="Null when include_total=false")
+    total_pages: Optional[int] = Field(0, description="Null when include_total=false")
+    has_next: Optional[bool] = None
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the following page")
+    prev_cursor: Optional[str] = Field(None, description="Opaque cursor for the preceding page")
 
 class Page(BaseSchema, Generic[T]):
     items: List[T] = Field(default_factory=list)
     meta: PaginationMeta
 
+class BulkLineResult(BaseSchema):
+    line: int
+    ok: bool
+    id: Optional[int] = None
+    slug: Optional[str] = None
+    error: Optional[str] = None
+
+class BulkResult(BaseSchema):
+    created: int = 0
+    failed: int = 0
+    results: List[BulkLineResult] = Field(default_factory=list)
+
 class ErrorResponse(BaseSchema):
     success: bool = False
     message: str
@@ -0,0 +1,340 @@
+"""
+End-to-end benchmark of the API: drives app.main:app in-process (httpx ASGITransport, lifespan included)
+against the configured Postgres and reports, per scenario, throughput, p50/p95/p99 latency and SQL
+statements per request, as reported by the app's own Server-Timing header (REQUEST_METRICS_ENABLED and
+SERVER_TIMING_ENABLED must be on), so reads on replicas and on the read session factory are counted too.
+
+    python -m app.scripts.bench --generate 20000             # (re)create the bench-* dataset first
+    python -m app.scripts.bench --out bench/base.json        # store a run
+    python -m app.scripts.bench --baseline bench/base.json   # exit 1 if a scenario regressed
+
+A run fails (exit code 1) when, against --baseline, a scenario's p95 grows by more than --max-regression
+(and by at least --min-regression-ms), or it issues more queries per request; and when a --thresholds file
+budget is exceeded, e.g. {"list_shallow": {"p95_ms": 5, "queries_per_request": 0}}.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.db.session import async_engine, async_session_factory
+from app.main import app
+from app.models.project_card import ProjectCard
+from app.models.project_tag import ProjectTag
+from app.scripts import seed
+
+BASE = "/api/v1"
+PREFIX = "bench"
+
+# db;dur=<ms>;desc="<n> queries, <rows> rows" from app.core.request_metrics
+_QUERIES_RE = re.compile(r'desc="(\d+) queries')
+
+
+def _query_count(response: httpx.Response) -> int:
+    match = _QUERIES_RE.search(response.headers.get("server-timing", ""))
+    if match is None:
+        raise SystemExit("no query count in Server-Timing: enable REQUEST_METRICS_ENABLED and SERVER_TIMING_ENABLED")
+    return int(match.group(1))
+
+
+class Call(NamedTuple):
+    method: str
+    url: str
+    json: Any = None
+
+
+class Scenario(NamedTuple):
+    name: str
+    call: Callable[[int], Call]
+    write: bool = False
+
+
+class Dataset(NamedTuple):
+    lang: str
+    published: int
+    slugs: List[str]
+    popular_tags: List[int]
+    rare_tag: Optional[int]
+    q: str
+
+
+async def load_dataset(lang: str, q: Optional[str]) -> Dataset:
+    async with async_session_factory() as db:
+        published = ProjectCard.lang == lang, ProjectCard.status == "published"
+        total = (await db.execute(select(func.count()).select_from(ProjectCard).where(*published))).scalar_one()
+        slugs = (await db.execute(
+            select(ProjectCard.slug).where(*published).order_by(ProjectCard.project_id).limit(200)
+        )).scalars().all()
+        usage = func.count(ProjectTag.project_id)
+        tags = (await db.execute(
+            select(ProjectTag.tag_id).group_by(ProjectTag.tag_id).order_by(usage.desc(), ProjectTag.tag_id)
+        )).scalars().all()
+    return Dataset(
+        lang=lang,
+        published=total,
+        slugs=list(slugs),
+        popular_tags=list(tags[:2]),
+        rare_tag=tags[-1] if tags else None,
+        q=q or seed.WORDS[lang][0],
+    )
+
+
+def build_scenarios(data: Dataset, page_size: int, run_id: str, created: List[str]) -> List[Scenario]:
+    lang, size = data.lang, page_size
+    last_page = max(1, -(-data.published // size))
+    popular = ",".join(str(t) for t in data.popular_tags)
+
+    def detail(i: int) -> Call:
+        return Call("GET", f"{BASE}/projects/{data.slugs[i % len(data.slugs)]}?lang={lang}")
+
+    def create(i: int) -> Call:
+        slug = f"{PREFIX}-write-{run_id}-{i}"
+        created.append(slug)
+        return Call("POST", f"{BASE}/projects", {
+            "slug": slug,
+            "status": "published",
+            "tag_ids": data.popular_tags[:1],
+            "translations": [{
+                "lang": lang,
+                "title": f"Bench write {i}",
+                "summary": "Created by the benchmark",
+                "content_markdown": "## Bench\n\nCreated by the benchmark and deleted again.",
+            }],
+        })
+
+    def delete(i: int) -> Call:
+        if not created:
+            raise SystemExit("admin_delete ran out of projects to delete: it only removes what admin_create made")
+        return Call("DELETE", f"{BASE}/projects/{created.pop()}")
+
+    scenarios = [
+        Scenario("list_shallow", lambda i: Call("GET", f"{BASE}/projects?lang={lang}&page_size={size}")),
+        Scenario("list_deep", lambda i: Call("GET", f"{BASE}/projects?lang={lang}&page_size={size}&page={last_page}")),
+        Scenario("search_q", lambda i: Call("GET", f"{BASE}/projects?lang={lang}&page_size={size}&q={data.q}")),
+        Scenario("detail", detail),
+        Scenario("tags_list", lambda i: Call("GET", f"{BASE}/tags?lang={lang}")),
+        Scenario("admin_create", create, write=True),
+        Scenario("admin_delete", delete, write=True),
+    ]
+    if data.popular_tags:
+        scenarios[3:3] = [
+            Scenario("tags_any", lambda i: Call("GET", f"{BASE}/projects?lang={lang}&page_size={size}&tag_ids={popular}")),
+            Scenario("tags_all", lambda i: Call("GET", f"{BASE}/projects?lang={lang}&page_size={size}&tag_ids={popular}&tag_mode=all")),
+            Scenario("tags_rare", lambda i: Call("GET", f"{BASE}/projects?lang={lang}&page_size={size}&tag_ids={data.rare_tag}")),
+        ]
+    return scenarios
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Linear interpolation between closest ranks."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+async def _timed(client: httpx.AsyncClient, call: Call, headers: Dict[str, str]) -> Tuple[float, int, int]:
+    started = time.perf_counter()
+    response = await client.request(call.method, call.url, json=call.json, headers=headers)
+    elapsed = time.perf_counter() - started
+    return elapsed, response.status_code, _query_count(response)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    headers: Dict[str, str],
+) -> Dict[str, Any]:
+    for i in range(0 if scenario.write else warmup):
+        await _timed(client, scenario.call(i), headers)
+
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors = 0
+    next_i = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in next_i:
+            elapsed, status, n = await _timed(client, scenario.call(i), headers)
+            latencies.append(elapsed)
+            queries.append(n)
+            if status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(1 if scenario.write else concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [v * 1000 for v in latencies]
+    return {
+        "requests": len(ms),
+        "errors": errors,
+        "rps": round(len(ms) / wall, 1) if wall else None,
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "max_ms": round(ms[-1], 3),
+        "queries_per_request": round(statistics.fmean(queries), 2),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Optional[Dict[str, Dict[str, Any]]],
+    thresholds: Dict[str, Dict[str, float]],
+    max_regression: float,
+    min_regression_ms: float,
+) -> List[str]:
+    failures: List[str] = []
+    for name, r in results.items():
+        if r["errors"]:
+            failures.append(f"{name}: {r['errors']} error responses")
+        for metric, budget in thresholds.get(name, {}).items():
+            if metric in r and r[metric] > budget:
+                failures.append(f"{name}: {metric} {r[metric]} > budget {budget}")
+        base = (baseline or {}).get(name)
+        if base is None:
+            continue
+        limit = max(base["p95_ms"] * (1 + max_regression), base["p95_ms"] + min_regression_ms)
+        if r["p95_ms"] > limit:
+            failures.append(f"{name}: p95 {r['p95_ms']}ms > {limit:.3f}ms (baseline {base['p95_ms']}ms)")
+        if r["queries_per_request"] > base["queries_per_request"]:
+            failures.append(f"{name}: {r['queries_per_request']} queries/request > baseline {base['queries_per_request']}")
+    return failures
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_table(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]]) -> None:
+    print(f"{'scenario':<14}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}{'errors':>8}  vs baseline p95")
+    for name, r in results.items():
+        base = (baseline or {}).get(name)
+        delta = f"{(r['p95_ms'] / base['p95_ms'] - 1) * 100:+.0f}%" if base and base["p95_ms"] else ""
+        print(f"{name:<14}{r['rps']:>9}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+              f"{r['queries_per_request']:>9}{r['errors']:>8}  {delta}")
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.generate:
+        await seed.generate(seed.build_parser().parse_args(
+            ["--projects", str(args.generate), "--prefix", PREFIX, "--replace", "--no-render"]
+        ))
+
+    data = await load_dataset(args.lang, args.q)
+    if not data.slugs:
+        raise SystemExit("no published projects to benchmark; run with --generate N")
+
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    created: List[str] = []
+    scenarios = build_scenarios(data, args.page_size, run_id, created)
+    if args.scenarios:
+        unknown = set(args.scenarios) - {s.name for s in scenarios}
+        if unknown:
+            raise SystemExit(f"unknown scenarios: {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s.name in args.scenarios]
+    names = [s.name for s in scenarios]
+    if "admin_delete" in names and ("admin_create" not in names or names.index("admin_create") > names.index("admin_delete")):
+        raise SystemExit("admin_delete deletes the projects admin_create made: select admin_create too")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            login = await client.post(f"{BASE}/auth/login", json={
+                "username": settings.ADMIN_USERNAME, "password": settings.ADMIN_PASSWORD,
+            })
+            headers = {}
+            if login.status_code == 200:
+                headers["Authorization"] = f"Bearer {login.json()['data']['access_token']}"
+
+            for scenario in scenarios:
+                requests = args.write_requests if scenario.write else args.requests
+                results[scenario.name] = await run_scenario(
+                    client, scenario, requests, args.concurrency, args.warmup, headers
+                )
+                print(f"  {scenario.name}: done", file=sys.stderr, flush=True)
+
+            # admin_delete not selected: drop what admin_create left behind, unmeasured
+            while created:
+                await client.delete(f"{BASE}/projects/{created.pop()}", headers=headers)
+    await async_engine.dispose()
+
+    return {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "lang": data.lang,
+            "published_projects": data.published,
+            "catalog_enabled": settings.CATALOG_ENABLED,
+            "requests": args.requests,
+            "write_requests": args.write_requests,
+            "concurrency": args.concurrency,
+            "page_size": args.page_size,
+        },
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the API in-process against the configured database.")
+    parser.add_argument("--generate", type=int, default=0, metavar="N", help=f"first regenerate N {PREFIX}-* projects")
+    parser.add_argument("--lang", default="en", choices=["en", "vi"])
+    parser.add_argument("--q", default=None, help="search term for search_q (default: a word of the generated text)")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per scenario")
+    parser.add_argument("--write-requests", type=int, default=10, help="measured requests per admin write scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="concurrent clients for read scenarios")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per read scenario")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", default=None, help="run only these scenarios")
+    parser.add_argument("--out", type=Path, default=None, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON of an earlier run to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed relative p95 growth vs baseline")
+    parser.add_argument("--min-regression-ms", type=float, default=1.0, help="ignore p95 growth below this many ms")
+    parser.add_argument("--thresholds", type=Path, default=None, help="JSON of absolute budgets per scenario")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())["scenarios"] if args.baseline else None
+    thresholds = json.loads(args.thresholds.read_text()) if args.thresholds else {}
+
+    report = asyncio.run(bench(args))
+    _print_table(report["scenarios"], baseline)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2) + "\n")
+
+    failures = compare(report["scenarios"], baseline, thresholds, args.max_regression, args.min_regression_ms)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Render every public read to JSON files, in the ApiResponse shape the API returns:
+
+    <out>/projects/<lang>/index.json              == GET /projects?lang=<lang>
+    <out>/projects/<lang>/page/<n>.json           == ...&page=<n>
+    <out>/projects/<lang>/tag/<tag>/page/<n>.json == ...&tag_ids=<id of tag>&page=<n> (index.json = page 1)
+    <out>/projects/<lang>/p/<slug>.json           == GET /projects/<slug>?lang=<lang>
+    <out>/tags/<lang>/page/<n>.json               == GET /tags?lang=<lang>&page=<n> (index.json = page 1)
+    <out>/manifest.json                           content versions and page counts
+
+Only files whose bytes changed are rewritten (temp file + rename), and files no longer produced are removed.
+Cursors are dropped from meta: a static host cannot follow them. Projects and tags whose slug is not a safe
+single path segment (empty, ".", "..", a leading dot, "/" or "\\") are skipped with a warning.
+
+    python -m app.scripts.export_static --out public/api/v1
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set, get_args
+
+from app.db.session import async_session_factory
+from app.modules.projects.catalog import load_snapshot
+from app.modules.tags.repository import list_tags_paginated
+from app.schemas.common import ApiResponse, Lang, Page
+
+
+def _safe_segment(slug: str) -> bool:
+    """Usable as one file or directory name under --out, without clashing with temp files."""
+    return bool(slug) and not slug.startswith(".") and not any(c in slug for c in "/\\\0")
+
+
+class StaticWriter:
+    def __init__(self, out: Path):
+        self.out = out
+        self.seen: Set[Path] = set()
+        self.written = 0
+        self.unchanged = 0
+
+    def write(self, rel: str, data: Any) -> None:
+        path = self.out / rel
+        self.seen.add(path)
+        self._write_bytes(path, ApiResponse.model_construct(data=data).model_dump_json().encode())
+
+    def write_raw(self, rel: str, body: bytes) -> None:
+        path = self.out / rel
+        self.seen.add(path)
+        self._write_bytes(path, body)
+
+    def _write_bytes(self, path: Path, body: bytes) -> None:
+        try:
+            if path.read_bytes() == body:
+                self.unchanged += 1
+                return
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)  # readers see the old file or the new one, never a partial write
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.written += 1
+
+    def prune(self) -> int:
+        removed = 0
+        for root in (self.out / "projects", self.out / "tags"):
+            if not root.exists():
+                continue
+            for path in root.rglob("*.json"):
+                if path not in self.seen:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+
+def _static_page(page: Page) -> Page:
+    return page.model_copy(update={"meta": page.meta.model_copy(update={"next_cursor": None, "prev_cursor": None})})
+
+
+def _write_pages(writer: StaticWriter, prefix: str, pages: List[Page]) -> int:
+    for n, page in enumerate(pages, start=1):
+        page = _static_page(page)
+        writer.write(f"{prefix}/page/{n}.json", page)
+        if n == 1:
+            writer.write(f"{prefix}/index.json", page)
+    return len(pages)
+
+
+def _all_pages(fetch: Callable[[int], Page]) -> List[Page]:
+    pages = [fetch(1)]
+    while pages[-1].meta.has_next:
+        pages.append(fetch(len(pages) + 1))
+    return pages
+
+
+async def export(out: Path, page_size: int, prune: bool) -> Dict[str, Any]:
+    snapshot = await load_snapshot()
+    writer = StaticWriter(out)
+    manifest: Dict[str, Any] = {
+        "versions": {scope: v.version for scope, v in snapshot.versions.items()},
+        "page_size": page_size,
+        "projects": {},
+        "tags": {},
+    }
+    skipped: List[str] = []
+
+    for lang in snapshot.langs():
+        pages = _write_pages(writer, f"projects/{lang}", _all_pages(
+            lambda n: snapshot.list_projects(lang, page=n, page_size=page_size)
+        ))
+        tag_pages: Dict[str, int] = {}
+        tags = {t.id: t for item in snapshot.items(lang) for t in item.tags}
+        for tag in sorted(tags.values(), key=lambda t: t.id):
+            if not _safe_segment(tag.slug):
+                skipped.append(f"tag {tag.id} ({lang}): {tag.slug!r}")
+                continue
+            tag_pages[tag.slug] = _write_pages(writer, f"projects/{lang}/tag/{tag.slug}", _all_pages(
+                lambda n: snapshot.list_projects(lang, page=n, page_size=page_size, tag_ids=[tag.id])
+            ))
+        for item in snapshot.items(lang):
+            if not _safe_segment(item.slug):
+                skipped.append(f"project {item.id} ({lang}): {item.slug!r}")
+                continue
+            writer.write(f"projects/{lang}/p/{item.slug}.json", snapshot.detail(item.slug, lang))
+        manifest["projects"][lang] = {"pages": pages, "items": len(snapshot.items(lang)), "tags": tag_pages}
+
+    async with async_session_factory() as db:
+        for lang in get_args(Lang):
+            pages = [await list_tags_paginated(db, lang=lang, page=1, page_size=page_size)]
+            while pages[-1].meta.has_next:
+                pages.append(await list_tags_paginated(db, lang=lang, page=len(pages) + 1, page_size=page_size))
+            manifest["tags"][lang] = {"pages": _write_pages(writer, f"tags/{lang}", pages)}
+
+    writer.write_raw("manifest.json", json.dumps(manifest, indent=2, sort_keys=True).encode())
+    removed = writer.prune() if prune else 0
+    return {"written": writer.written, "unchanged": writer.unchanged, "removed": removed, "skipped": skipped}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render the public API to static JSON files.")
+    parser.add_argument("--out", type=Path, default=Path("public/api/v1"))
+    parser.add_argument("--page-size", type=int, default=10, help="same default as the API")
+    parser.add_argument("--no-prune", action="store_true", help="keep files that are no longer produced")
+    args = parser.parse_args()
+
+    stats = asyncio.run(export(args.out, max(1, min(args.page_size, 100)), prune=not args.no_prune))
+    for entry in stats["skipped"]:
+        print(f"warning: skipped unsafe slug of {entry}", file=sys.stderr)
+    print(f"static export: {stats['written']} written, {stats['unchanged']} unchanged, {stats['removed']} removed -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Remove uploads that no project references any more, once they have stayed unreferenced for the grace period.
+
+    python -m app.scripts.media_gc [--grace SECONDS] [--limit N] [--recount] [--dry-run]
+
+Stored objects (media_objects rows with ref_count = 0) go oldest first and are re-checked against the projects
+while their row is locked, so an upload of the same bytes in the meantime keeps them. Files in the upload dir
+without a row (uploaded before the content-addressed store) are removed too when older than the grace period
+and referenced nowhere, as are temp files of uploads that never finished.
+At most --limit files go per run: run it from cron as often as you like.
+"""
+import argparse
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from app.core.config import settings
+from app.db.session import async_session_factory
+from app.modules.media.repository import delete_media, is_referenced, known_media, lock_garbage, refresh_media_refs
+
+_BATCH = 500
+
+
+def _remove(path: Path, dry_run: bool) -> int:
+    """Bytes freed; 0 when the file is already gone."""
+    try:
+        size = path.stat().st_size
+        if dry_run:
+            print(f"would remove {path.name} ({size} bytes)")
+        else:
+            path.unlink()
+        return size
+    except FileNotFoundError:
+        return 0
+
+
+def _old_files(directory: Path, cutoff: float) -> List[str]:
+    with os.scandir(directory) as entries:
+        return sorted(e.name for e in entries if e.is_file() and e.stat().st_mtime < cutoff)
+
+
+async def collect(directory: Path, grace: float, limit: int, recount: bool = False, dry_run: bool = False) -> Dict[str, int]:
+    stats = {"objects": 0, "files": 0, "bytes": 0}
+    before = datetime.now(timezone.utc) - timedelta(seconds=grace)
+
+    async with async_session_factory() as db:
+        if recount:
+            # picks up references added or dropped behind the API's back (SQL, restores)
+            await refresh_media_refs(db)
+            await db.commit()
+
+        while stats["objects"] < limit:
+            keys = await lock_garbage(db, before, min(_BATCH, limit - stats["objects"]))
+            if not keys:
+                break
+            # files go while the rows are locked; the rows only after, so a failure leaves nothing dangling
+            stats["bytes"] += sum(_remove(directory / key, dry_run) for key in keys)
+            stats["objects"] += len(keys)
+            if dry_run:
+                await db.rollback()
+                break
+            await delete_media(db, keys)
+            await db.commit()
+
+        names = _old_files(directory, before.timestamp())
+        for i in range(0, len(names), _BATCH):
+            batch = names[i:i + _BATCH]
+            known = await known_media(db, batch)
+            for name in batch:
+                if stats["objects"] + stats["files"] >= limit:
+                    return stats
+                if name in known or (name.startswith(".") and not name.startswith(".upload-")):
+                    continue
+                # .upload-*.part: temp file of a request that died before its cleanup ran
+                if not name.startswith(".upload-") and await is_referenced(db, name):
+                    continue
+                stats["bytes"] += _remove(directory / name, dry_run)
+                stats["files"] += 1
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove unreferenced uploads after a grace period.")
+    parser.add_argument("--grace", type=float, default=settings.MEDIA_GC_GRACE_SECONDS, help="seconds unreferenced before removal")
+    parser.add_argument("--limit", type=int, default=1000, help="files removed per run at most")
+    parser.add_argument("--recount", action="store_true", help="recount every object's references first")
+    parser.add_argument("--dry-run", action="store_true", help="list what would be removed")
+    args = parser.parse_args()
+
+    stats = asyncio.run(collect(settings.UPLOAD_DIR, args.grace, max(1, args.limit), recount=args.recount, dry_run=args.dry_run))
+    verb = "would remove" if args.dry_run else "removed"
+    print(f"media gc: {verb} {stats['objects']} objects and {stats['files']} untracked files, {stats['bytes']} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,44 @@
+"""
+python -m app.scripts.seed                      # the single demo tag + project
+python -m app.scripts.seed --projects 100000    # deterministic synthetic catalog, see --help
+"""
+import argparse
 import asyncio
-from sqlalchemy import select
+import random
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import List, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.markdown import content_hash, render_markdown
 from app.db.session import async_session_factory
+from app.db.versions import bump_versions, PROJECTS, TAGS
+from app.models.project_card import ProjectCard
+from app.modules.projects.cards import refresh_project_cards
 from app.models.project import Project
 from app.models.project_translation import ProjectTranslation
 from app.models.tag_translation import TagTranslation
 from app.models.tag import Tag
 from app.models.project_tag import ProjectTag
 
-async def main():
+
+def _rendered(markdown: str) -> dict:
+    rendered = render_markdown(markdown)
+    return {
+        "content_markdown": markdown,
+        "content_html": rendered.html,
+        "content_toc": rendered.toc,
+        "reading_minutes": rendered.reading_minutes,
+        "content_hash": content_hash(markdown),
+    }
+
+
+async def seed_demo():
     async with async_session_factory() as db:
         tag_slug = "fastapi"
         tag = (await db.execute(select(Tag).where(Tag.slug == tag_slug))).scalar_one_or_none()
@@ -40,22 +71,190 @@ async def main():
                     lang="vi",
                     title="Dự án portfolio",
                     summary="FastAPI + PostgreSQL",
-                    content_markdown="# Xin chào\n\nĐây là bài viết Markdown tiếng Việt."
-
+                    **_rendered("# Xin chào\n\nĐây là bài viết Markdown tiếng Việt."),
                 ),
                 ProjectTranslation(
                     project_id=project.id,
                     lang="en",
                     title="Portfolio project",
                     summary="FastAPI + PostgreSQL",
-                    content_markdown="# Hello\n\nThis is the English Markdown post."
+                    **_rendered("# Hello\n\nThis is the English Markdown post."),
                 )
             ])
 
             db.add(ProjectTag(project_id=project.id, tag_id=tag.id))
 
+        # public reads and the catalog go through the cards, and caches through the versions
+        await refresh_project_cards(db, [project.id])
+        await bump_versions(db, PROJECTS, TAGS)
         await db.commit()
         print("Seeding OK")
 
+
+EN_WORDS = (
+    "api backend service cache query index latency throughput deploy docker pipeline stream batch schema "
+    "migration database postgres python fastapi async worker queue metrics tracing search ranking page "
+    "cursor token session pool replica snapshot render markdown upload storage bucket image frontend react "
+    "build release monitor alert design system scale load test benchmark profile memory cpu network"
+).split()
+VI_WORDS = (
+    "dự án hệ thống máy chủ dữ liệu truy vấn bộ nhớ đệm hiệu năng triển khai kiểm thử giao diện người dùng "
+    "tìm kiếm phân trang tốc độ xử lý luồng tác vụ hàng đợi giám sát cảnh báo thiết kế mở rộng tải trọng "
+    "tối ưu mạng lưu trữ hình ảnh bài viết nội dung phiên bản phát hành ứng dụng dịch vụ cơ sở chỉ mục"
+).split()
+WORDS = {"en": EN_WORDS, "vi": VI_WORDS}
+
+
+class Generator:
+    """Deterministic synthetic rows: the same arguments and seed always produce the same catalog."""
+
+    def __init__(self, args: argparse.Namespace, tag_ids: Sequence[int]):
+        self.args = args
+        self.tag_ids = list(tag_ids)
+        self.rng = random.Random(args.seed)
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # Zipf-like popularity: tag i is picked with weight 1 / (i + 1) ** skew
+        weights = [1 / (i + 1) ** args.tag_skew for i in range(len(self.tag_ids))]
+        self.cum_weights = list(accumulate(weights))
+
+    def words(self, lang: str, n: int) -> str:
+        return " ".join(self.rng.choices(WORDS[lang], k=n))
+
+    def markdown(self, lang: str) -> str:
+        total = self.args.words
+        parts: List[str] = []
+        section = 0
+        while total > 0:
+            section += 1
+            n = min(total, self.rng.randint(40, 120))
+            parts.append(f"## {self.words(lang, 3).capitalize()} {section}\n\n{self.words(lang, n).capitalize()}.")
+            total -= n
+        return "\n\n".join(parts)
+
+    def pick_tags(self) -> List[int]:
+        lo, hi = self.args.tags_per_project
+        k = min(self.rng.randint(lo, hi), len(self.tag_ids))
+        picked = set()
+        while len(picked) < k:
+            r = self.rng.random() * self.cum_weights[-1]
+            picked.add(self.tag_ids[bisect_left(self.cum_weights, r)])
+        return sorted(picked)
+
+    def project(self, i: int) -> Tuple[dict, List[dict], List[int]]:
+        published = self.rng.random() >= self.args.draft_ratio
+        row = {
+            "slug": f"{self.args.prefix}-{i:07d}",
+            "status": "published" if published else "draft",
+            "published_at": self.now - timedelta(minutes=self.rng.randint(0, 5 * 365 * 24 * 60)) if published else None,
+            "repo_url": f"https://github.com/example/{self.args.prefix}-{i}",
+            "demo_url": None,
+            "cover_image_url": None,
+        }
+        translations = []
+        for lang in self.args.langs:
+            md = self.markdown(lang)
+            tr = {
+                "lang": lang,
+                "title": self.words(lang, self.rng.randint(2, 6)).capitalize(),
+                "summary": self.words(lang, self.rng.randint(8, 24)).capitalize(),
+                "content_markdown": md,
+                "content_html": None,
+                "content_toc": None,
+                "reading_minutes": None,
+                "content_hash": None,
+            }
+            if self.args.render:
+                rendered = render_markdown(md)
+                tr.update(content_html=rendered.html, content_toc=rendered.toc,
+                          reading_minutes=rendered.reading_minutes, content_hash=content_hash(md))
+            translations.append(tr)
+        return row, translations, self.pick_tags()
+
+
+async def _ensure_tags(db: AsyncSession, args: argparse.Namespace) -> List[int]:
+    slugs = [f"{args.prefix}-tag-{i:04d}" for i in range(args.tags)]
+    await db.execute(pg_insert(Tag).on_conflict_do_nothing(index_elements=["slug"]), [{"slug": s} for s in slugs])
+    ids = dict((await db.execute(select(Tag.slug, Tag.id).where(Tag.slug.in_(slugs)))).all())
+    await db.execute(
+        pg_insert(TagTranslation).on_conflict_do_nothing(index_elements=["tag_id", "lang"]),
+        [
+            {"tag_id": ids[s], "lang": lang, "name": f"{WORDS[lang][i % len(WORDS[lang])]} {i}"}
+            for i, s in enumerate(slugs)
+            for lang in ("en", "vi")
+        ],
+    )
+    return [ids[s] for s in slugs]
+
+
+async def generate(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    async with async_session_factory() as db:
+        if args.replace:
+            old_ids = select(Project.id).where(Project.slug.like(f"{args.prefix}-%"))
+            for model in (ProjectCard, ProjectTag, ProjectTranslation):
+                await db.execute(delete(model).where(model.project_id.in_(old_ids)))
+            await db.execute(delete(Project).where(Project.slug.like(f"{args.prefix}-%")))
+
+        tag_ids = await _ensure_tags(db, args) if args.tags else []
+        await db.commit()
+        gen = Generator(args, tag_ids)
+
+        for start in range(0, args.projects, args.batch_size):
+            batch = [gen.project(i) for i in range(start, min(start + args.batch_size, args.projects))]
+
+            # one multi-row INSERT per table per batch
+            inserted = (await db.execute(insert(Project).returning(Project.id, Project.slug), [p for p, _, _ in batch])).all()
+            ids = dict((r.slug, r.id) for r in inserted)
+            await db.execute(
+                insert(ProjectTranslation),
+                [{**tr, "project_id": ids[p["slug"]]} for p, trs, _ in batch for tr in trs],
+            )
+            links = [{"project_id": ids[p["slug"]], "tag_id": t} for p, _, tags in batch for t in tags]
+            if links:
+                await db.execute(insert(ProjectTag), links)
+            await refresh_project_cards(db, ids.values())
+            await db.commit()
+            done = start + len(batch)
+            print(f"  {done}/{args.projects} projects ({time.perf_counter() - started:.1f}s)", flush=True)
+
+        await bump_versions(db, PROJECTS, TAGS)
+        await db.commit()
+    print(f"Generated {args.projects} projects, {args.tags} tags in {time.perf_counter() - started:.1f}s")
+
+
+def _range(value: str) -> Tuple[int, int]:
+    lo, _, hi = value.partition("-")
+    lo_i, hi_i = int(lo), int(hi or lo)
+    if lo_i < 0 or hi_i < lo_i:
+        raise argparse.ArgumentTypeError("expected N or MIN-MAX")
+    return lo_i, hi_i
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Seed the demo rows, or generate a synthetic catalog with --projects.")
+    parser.add_argument("--projects", type=int, default=0, help="number of projects to generate (0 = demo seed only)")
+    parser.add_argument("--tags", type=int, default=200, help="size of the generated tag vocabulary")
+    parser.add_argument("--tags-per-project", type=_range, default=(1, 5), metavar="N|MIN-MAX")
+    parser.add_argument("--tag-skew", type=float, default=1.1, help="Zipf exponent of tag popularity; 0 = uniform")
+    parser.add_argument("--words", type=int, default=300, help="words of markdown per translation")
+    parser.add_argument("--draft-ratio", type=float, default=0.1)
+    parser.add_argument("--langs", nargs="+", default=["en", "vi"], choices=["en", "vi"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="gen", help="slug prefix of generated projects and tags")
+    parser.add_argument("--replace", action="store_true", help="delete previously generated projects with this prefix first")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--no-render", dest="render", action="store_false", help="leave content_html/toc empty (faster)")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    if args.projects > 0:
+        asyncio.run(generate(args))
+    else:
+        asyncio.run(seed_demo())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
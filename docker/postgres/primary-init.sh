@@ -0,0 +1,4 @@
+#!/bin/sh
+# runs once, when the primary's data volume is initialized: let the replica stream WAL
+set -e
+echo "host replication ${POSTGRES_USER} all scram-sha-256" >> "$PGDATA/pg_hba.conf"